@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+import ipaddress
 import logging
 import os
 from pathlib import Path
 import socket
 import time
+from typing import Any
+from weakref import WeakKeyDictionary
 
 from aiohttp import ClientConnectionError, ClientResponseError, ClientSession
 import async_timeout
@@ -16,7 +22,7 @@ import voluptuous as vol
 from websocket import WebSocketException
 
 from homeassistant.components.http import StaticPathConfig
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import SOURCE_IGNORE, ConfigEntry, ConfigEntryState
 from homeassistant.const import (
     ATTR_DEVICE_ID,
     CONF_ACCESS_TOKEN,
@@ -39,9 +45,9 @@ from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers import config_entry_oauth2_flow
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.json import json_loads
 
 from .api.art import SamsungTVAsyncArt
 from .api.samsungws import ConnectionFailure, SamsungTVWS
@@ -72,6 +78,8 @@ from .const import (
     DATA_CFG,
     DATA_CFG_YAML,
     DATA_OPTIONS,
+    DATA_OPTIONS_CALLBACK,
+    DATA_PENDING_TOKENS,
     DEFAULT_PORT,
     DEFAULT_SOURCE_LIST,
     DEFAULT_TIMEOUT,
@@ -83,7 +91,6 @@ from .const import (
     RESULT_ST_DEVICE_NOT_FOUND,
     RESULT_SUCCESS,
     RESULT_WRONG_APIKEY,
-    SIGNAL_CONFIG_ENTITY,
     WS_PREFIX,
     AUTH_METHOD_OAUTH,
     AUTH_METHOD_PAT,
@@ -105,6 +112,17 @@ DEVICE_INFO = {
     ATTR_DEVICE_MODEL: "modelName",
     ATTR_DEVICE_OS: "OS",
 }
+_DEVICE_INFO_ITEMS = tuple(DEVICE_INFO.items())
+
+_OPTION_LIST_KEYS = (CONF_APP_LIST, CONF_CHANNEL_LIST, CONF_SOURCE_LIST)
+_SYNC_ENT_KEYS = (CONF_SYNC_TURN_OFF, CONF_SYNC_TURN_ON)
+
+STATIC_LOGO_PATH = Path(__file__).parent / "static"
+
+HOST_RESOLVE_CACHE_SIZE = 32
+HOST_RESOLVE_TTL = 300
+WS_AUTH_TIMEOUT = 45
+OAUTH_TOKEN_STALE_BUFFER = 600  # Refresh OAuth token in background 10 minutes before expiration
 
 SAMSMART_PLATFORM = [Platform.SENSOR, Platform.MEDIA_PLAYER, Platform.REMOTE, Platform.SWITCH]
 
@@ -117,15 +135,63 @@ SAMSMART_SCHEMA = {
     vol.Optional(CONF_BROADCAST_ADDRESS): cv.string,
 }
 
+_SAMSMART_KEYS = frozenset(key.schema for key in SAMSMART_SCHEMA)
+
+SAMSMART_ENTRY_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): cv.string,
+        vol.Optional(CONF_NAME): cv.string,
+        vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.port,
+        vol.Optional(CONF_API_KEY): cv.string,
+        vol.Optional(CONF_DEVICE_NAME): cv.string,
+        vol.Optional(CONF_DEVICE_ID): cv.string,
+        vol.Optional(CONF_LOAD_ALL_APPS, default=True): cv.boolean,
+        vol.Optional(CONF_UPDATE_METHOD): cv.string,
+        vol.Optional(CONF_UPDATE_CUSTOM_PING_URL): cv.string,
+        vol.Optional(CONF_SCAN_APP_HTTP, default=True): cv.boolean,
+        vol.Optional(CONF_SHOW_CHANNEL_NR, default=False): cv.boolean,
+        vol.Optional(CONF_WS_NAME): cv.string,
+    }
+).extend(SAMSMART_SCHEMA)
+
 
-def ensure_unique_hosts(value):
+async def async_resolve_host(hass: HomeAssistant, host: str) -> str:
+    """Resolve a host name to an IPv4 address, caching recent results.
+
+    Raises OSError when the name cannot be resolved.
+    """
+    try:
+        return str(ipaddress.ip_address(host))
+    except ValueError:
+        pass
+
+    now = time.monotonic()
+    if (cached := _RESOLVED_HOSTS.get(host)) and cached[0] > now:
+        _RESOLVED_HOSTS.move_to_end(host)
+        return cached[1]
+
+    infos = await hass.loop.getaddrinfo(
+        host, None, family=socket.AF_INET, type=socket.SOCK_STREAM
+    )
+    ip_address = infos[0][4][0]
+    _RESOLVED_HOSTS[host] = (now + HOST_RESOLVE_TTL, ip_address)
+    _RESOLVED_HOSTS.move_to_end(host)
+    if len(_RESOLVED_HOSTS) > HOST_RESOLVE_CACHE_SIZE:
+        _RESOLVED_HOSTS.popitem(last=False)
+    return ip_address
+
+
+async def async_ensure_unique_hosts(hass: HomeAssistant, value):
     """Validate that all configs have a unique host."""
-    vol.Schema(vol.Unique("duplicate host entries found"))(
-        [socket.gethostbyname(entry[CONF_HOST]) for entry in value]
+    resolved = await asyncio.gather(
+        *(async_resolve_host(hass, entry[CONF_HOST]) for entry in value)
     )
+    vol.Schema(vol.Unique("duplicate host entries found"))(resolved)
     return value
 
 
+# Host uniqueness requires DNS resolution, so it is checked in async_setup
+# instead of being part of the validation pipeline.
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.All(
@@ -136,24 +202,8 @@ CONFIG_SCHEMA = vol.Schema(
                 cv.deprecated(CONF_UPDATE_METHOD),
                 cv.deprecated(CONF_UPDATE_CUSTOM_PING_URL),
                 cv.deprecated(CONF_SCAN_APP_HTTP),
-                vol.Schema(
-                    {
-                        vol.Required(CONF_HOST): cv.string,
-                        vol.Optional(CONF_NAME): cv.string,
-                        vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.port,
-                        vol.Optional(CONF_API_KEY): cv.string,
-                        vol.Optional(CONF_DEVICE_NAME): cv.string,
-                        vol.Optional(CONF_DEVICE_ID): cv.string,
-                        vol.Optional(CONF_LOAD_ALL_APPS, default=True): cv.boolean,
-                        vol.Optional(CONF_UPDATE_METHOD): cv.string,
-                        vol.Optional(CONF_UPDATE_CUSTOM_PING_URL): cv.string,
-                        vol.Optional(CONF_SCAN_APP_HTTP, default=True): cv.boolean,
-                        vol.Optional(CONF_SHOW_CHANNEL_NR, default=False): cv.boolean,
-                        vol.Optional(CONF_WS_NAME): cv.string,
-                    }
-                ).extend(SAMSMART_SCHEMA),
+                SAMSMART_ENTRY_SCHEMA,
             ],
-            ensure_unique_hosts,
         )
     },
     extra=vol.ALLOW_EXTRA,
@@ -161,27 +211,63 @@ CONFIG_SCHEMA = vol.Schema(
 
 _LOGGER = logging.getLogger(__name__)
 
-# Global lock dictionary to prevent concurrent OAuth refresh per entry
+
+@dataclass(slots=True)
+class _OAuthState:
+    """OAuth refresh state for a config entry."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    in_progress: bool = False
+    refresh_timer: asyncio.TimerHandle | None = None
+
+
+@dataclass(slots=True)
+class _OAuthCache:
+    """Parsed OAuth token state for a config entry."""
+
+    token: dict
+    access_token: str
+    refresh_after: float
+
+
+# Global OAuth refresh state per entry id, cleared when the entry unloads
 # This is shared across all entities (media_player, switch, sensor)
-_OAUTH_REFRESH_LOCKS: dict[str, asyncio.Lock] = {}
-_OAUTH_REFRESH_IN_PROGRESS: dict[str, bool] = {}
+_OAUTH_STATES: dict[str, _OAuthState] = {}
+
+# Parsed OAuth token per entry, valid while entry token dict is unchanged
+_OAUTH_TOKEN_CACHE: WeakKeyDictionary[ConfigEntry, _OAuthCache] = WeakKeyDictionary()
+
+# SmartThings API key per ST entry id: (entry data, api key)
+_ST_API_KEY_CACHE: dict[str, tuple[Mapping[str, Any], str | None]] = {}
+
+# Recently resolved hosts, least recently used first: (expire time, ip address)
+_RESOLVED_HOSTS: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+
+def _get_oauth_state(entry_id: str) -> _OAuthState:
+    """Get or create the OAuth refresh state for a specific entry."""
+    if (state := _OAUTH_STATES.get(entry_id)) is None:
+        state = _OAUTH_STATES[entry_id] = _OAuthState()
+    return state
 
 
 def get_oauth_refresh_lock(entry_id: str) -> asyncio.Lock:
     """Get or create a lock for OAuth refresh for a specific entry."""
-    if entry_id not in _OAUTH_REFRESH_LOCKS:
-        _OAUTH_REFRESH_LOCKS[entry_id] = asyncio.Lock()
-    return _OAUTH_REFRESH_LOCKS[entry_id]
+    return _get_oauth_state(entry_id).lock
 
 
 def is_oauth_refresh_in_progress(entry_id: str) -> bool:
     """Check if OAuth refresh is already in progress for an entry."""
-    return _OAUTH_REFRESH_IN_PROGRESS.get(entry_id, False)
+    state = _OAUTH_STATES.get(entry_id)
+    return state is not None and state.in_progress
 
 
 def set_oauth_refresh_in_progress(entry_id: str, in_progress: bool) -> None:
     """Set OAuth refresh in progress state for an entry."""
-    _OAUTH_REFRESH_IN_PROGRESS[entry_id] = in_progress
+    if in_progress:
+        _get_oauth_state(entry_id).in_progress = True
+    elif state := _OAUTH_STATES.get(entry_id):
+        state.in_progress = False
 
 
 def tv_url(host: str, address: str = "") -> str:
@@ -196,6 +282,7 @@ def is_min_ha_version(min_ha_major_ver: int, min_ha_minor_ver: int) -> bool:
     )
 
 
+@lru_cache(maxsize=1)
 def is_valid_ha_version() -> bool:
     """Check if HA version is valid for this integration."""
     return is_min_ha_version(MIN_HA_MAJ_VER, MIN_HA_MIN_VER)
@@ -218,6 +305,12 @@ def _notify_message(
     )
 
 
+@lru_cache(maxsize=128)
+def _parse_option_list(src_list: str):
+    """Parse a JSON list parameter, caching the result by source string."""
+    return json_loads(src_list)
+
+
 def _load_option_list(src_list):
     """Load list parameters in JSON from configuration.yaml."""
 
@@ -225,78 +318,105 @@ def _load_option_list(src_list):
         return None
     if isinstance(src_list, dict):
         return src_list
-
-    result = {}
-    try:
-        result = json.loads(src_list)
-    except TypeError:
+    if not isinstance(src_list, str):
         _LOGGER.error("Invalid format parameter: %s", str(src_list))
+        return {}
+
+    result = _parse_option_list(src_list)
+    # cached results are shared, return a copy that callers can store
+    if isinstance(result, (dict, list)):
+        return result.copy()
     return result
 
 
+@lru_cache(maxsize=64)
 def token_file_name(hostname: str) -> str:
     """Return token file name."""
     return f"{DOMAIN}_{hostname}_token"
 
 
+@lru_cache(maxsize=64)
+def _token_storage_path(storage_path: str, hostname: str) -> str:
+    """Return token file path inside the storage folder."""
+    return os.path.join(storage_path, token_file_name(hostname))
+
+
 def _remove_token_file(hass, hostname, token_file=None):
     """Try to remove token file."""
     if not token_file:
-        token_file = hass.config.path(STORAGE_DIR, token_file_name(hostname))
+        token_file = _token_storage_path(hass.config.path(STORAGE_DIR), hostname)
 
-    if os.path.isfile(token_file):
-        try:
-            os.remove(token_file)
-        except Exception as exc:  # pylint: disable=broad-except
-            _LOGGER.error(
-                "Samsung TV - Error deleting token file %s: %s", token_file, str(exc)
-            )
+    try:
+        os.unlink(token_file)
+    except FileNotFoundError:
+        pass
+    except Exception as exc:  # pylint: disable=broad-except
+        _LOGGER.error(
+            "Samsung TV - Error deleting token file %s: %s", token_file, str(exc)
+        )
 
 
-def _migrate_token(hass: HomeAssistant, entry: ConfigEntry, hostname: str) -> None:
-    """Migrate token from old file to registry entry."""
-    token_file = hass.config.path(STORAGE_DIR, token_file_name(hostname))
-    if not os.path.isfile(token_file):
-        token_file = (
-            os.path.dirname(os.path.realpath(__file__)) + f"/token-{hostname}.txt"
-        )
-        if not os.path.isfile(token_file):
-            return
+def _load_token_file(hass: HomeAssistant, hostname: str) -> tuple[str, Path] | None:
+    """Load token from old file, return the token and the file path."""
+    token_paths = (
+        Path(_token_storage_path(hass.config.path(STORAGE_DIR), hostname)),
+        Path(__file__).resolve().parent / f"token-{hostname}.txt",
+    )
 
-    try:
-        with open(token_file, "r", encoding="utf-8") as os_token_file:
-            token = os_token_file.readline()
-    except Exception as exc:  # pylint: disable=broad-except
-        _LOGGER.error("Error reading token file %s: %s", token_file, str(exc))
-        return
+    for token_file in token_paths:
+        try:
+            with token_file.open("r", encoding="utf-8") as os_token_file:
+                token = os_token_file.readline()
+            break
+        except FileNotFoundError:
+            continue
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOGGER.error("Error reading token file %s: %s", token_file, str(exc))
+            return None
+    else:
+        return None
 
     if not token:
         _LOGGER.warning("No token found inside token file %s", token_file)
-        return
+        return None
+
+    return token, token_file
+
 
+async def _async_migrate_token(
+    hass: HomeAssistant, entry: ConfigEntry, token_info: tuple[str, Path]
+) -> None:
+    """Migrate token from old file to registry entry."""
+    token, token_file = token_info
     hass.config_entries.async_update_entry(
         entry, data={**entry.data, CONF_TOKEN: token}
     )
-    _remove_token_file(hass, hostname, token_file)
+    await hass.async_add_executor_job(
+        _remove_token_file, hass, entry.data[CONF_HOST], token_file
+    )
 
 
 @callback
 def _migrate_options_format(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Migrate options to new format."""
-    opt_migrated = False
-    new_options = {}
-
-    for key, option in entry.options.items():
-        if key in [CONF_SYNC_TURN_OFF, CONF_SYNC_TURN_ON]:
-            if isinstance(option, str):
-                new_options[key] = option.split(",")
-                opt_migrated = True
-                continue
-        new_options[key] = option
+    options = entry.options
+    # option lists are always stored after first migration, skip when done
+    if all(key in options for key in _OPTION_LIST_KEYS) and not any(
+        isinstance(options.get(key), str) for key in _SYNC_ENT_KEYS
+    ):
+        return
+
+    new_options = dict(options)
+
+    for key in _SYNC_ENT_KEYS:
+        if isinstance(option := new_options.get(key), str):
+            new_options[key] = option.split(",")
 
     # load the option lists in entry option
-    yaml_opt = hass.data.get(DOMAIN, {}).get(entry.entry_id, {}).get(DATA_CFG_YAML, {})
-    for key in [CONF_APP_LIST, CONF_CHANNEL_LIST, CONF_SOURCE_LIST]:
+    yaml_opt = {}
+    if domain_data := hass.data.get(DOMAIN):
+        yaml_opt = domain_data.get(entry.entry_id, {}).get(DATA_CFG_YAML, {})
+    for key in _OPTION_LIST_KEYS:
         if key not in new_options:  # import will occurs only on first restart
             if option := _load_option_list(yaml_opt.get(key, {})):
                 message = (
@@ -308,9 +428,8 @@ def _migrate_options_format(hass: HomeAssistant, entry: ConfigEntry) -> None:
                 )
                 _LOGGER.warning(message)
             new_options[key] = option
-            opt_migrated = True
 
-    if opt_migrated:
+    if new_options != options:
         hass.config_entries.async_update_entry(entry, options=new_options)
 
 
@@ -327,16 +446,16 @@ def _migrate_entry_unique_id(hass: HomeAssistant, entry: ConfigEntry) -> None:
     if entry.unique_id == new_unique_id:
         return
 
-    entries_list = hass.config_entries.async_entries(DOMAIN)
-    for other_entry in entries_list:
-        if other_entry.unique_id == new_unique_id:
-            _LOGGER.warning(
-                "Found duplicated entries %s and %s that refer to the same device."
-                " Please remove unused entry",
-                entry.data[CONF_HOST],
-                other_entry.data[CONF_HOST],
-            )
-            return
+    if other_entry := hass.config_entries.async_entry_for_domain_unique_id(
+        DOMAIN, new_unique_id
+    ):
+        _LOGGER.warning(
+            "Found duplicated entries %s and %s that refer to the same device."
+            " Please remove unused entry",
+            entry.data[CONF_HOST],
+            other_entry.data[CONF_HOST],
+        )
+        return
 
     _LOGGER.info(
         "Migrated entry unique id from %s to %s", entry.unique_id, new_unique_id
@@ -381,62 +500,211 @@ def get_smartthings_entries(hass: HomeAssistant) -> dict[str, str] | None:
     return result if result else None
 
 
-@callback
-def get_smartthings_api_key(hass: HomeAssistant, st_unique_id: str) -> str | None:
-    """Get the smartthing integration configured API key.
+def _get_st_entry_api_key(config_data, st_unique_id: str) -> str | None:
+    """Extract the API key from a smartthing integration entry data.
     
     Supports both:
     - Legacy PAT (Personal Access Token) - stored as string
     - OAuth tokens - stored as dict with access_token
     """
-    entries_list = hass.config_entries.async_entries(ST_DOMAIN, False, False)
-    if not entries_list:
-        return None
-
-    for entry in entries_list:
-        if entry.unique_id == st_unique_id:
-            config_data = entry.data
-            
-            # Try OAuth token structure first (new method)
-            # OAuth tokens are in entry.data['token'] as dict
-            if CONF_TOKEN in config_data:
-                token_data = config_data[CONF_TOKEN]
-                
-                # OAuth: token is a dict with access_token key
-                if isinstance(token_data, dict):
-                    if CONF_ACCESS_TOKEN in token_data:
-                        _LOGGER.debug(
-                            "SmartThings: Found OAuth access_token for %s", 
-                            st_unique_id
-                        )
-                        return token_data[CONF_ACCESS_TOKEN]
-                
-                # Legacy PAT: token is a string directly
-                elif isinstance(token_data, str):
-                    _LOGGER.debug(
-                        "SmartThings: Found legacy PAT token for %s", 
-                        st_unique_id
-                    )
-                    return token_data
-            
-            # Also try direct access_token key (alternative OAuth structure)
-            if CONF_ACCESS_TOKEN in config_data:
+    # Try OAuth token structure first (new method)
+    # OAuth tokens are in entry.data['token'] as dict
+    if CONF_TOKEN in config_data:
+        token_data = config_data[CONF_TOKEN]
+        
+        # OAuth: token is a dict with access_token key
+        if isinstance(token_data, dict):
+            if CONF_ACCESS_TOKEN in token_data:
                 _LOGGER.debug(
-                    "SmartThings: Found direct access_token for %s", 
+                    "SmartThings: Found OAuth access_token for %s", 
                     st_unique_id
                 )
-                return config_data[CONF_ACCESS_TOKEN]
-            
+                return token_data[CONF_ACCESS_TOKEN]
+        
+        # Legacy PAT: token is a string directly
+        elif isinstance(token_data, str):
+            _LOGGER.debug(
+                "SmartThings: Found legacy PAT token for %s", 
+                st_unique_id
+            )
+            return token_data
+    
+    # Also try direct access_token key (alternative OAuth structure)
+    if CONF_ACCESS_TOKEN in config_data:
+        _LOGGER.debug(
+            "SmartThings: Found direct access_token for %s", 
+            st_unique_id
+        )
+        return config_data[CONF_ACCESS_TOKEN]
+    
+    _LOGGER.warning(
+        "SmartThings: No valid token found for %s in entry data keys: %s",
+        st_unique_id,
+        list(config_data.keys())
+    )
+    return None
+
+
+@callback
+def get_smartthings_api_key(hass: HomeAssistant, st_unique_id: str) -> str | None:
+    """Get the smartthing integration configured API key."""
+    entry = hass.config_entries.async_entry_for_domain_unique_id(
+        ST_DOMAIN, st_unique_id
+    )
+    if entry is None or entry.source == SOURCE_IGNORE or entry.disabled_by:
+        return None
+
+    # entry data is replaced on every update, so identity means unchanged
+    config_data = entry.data
+    cached = _ST_API_KEY_CACHE.get(entry.entry_id)
+    if cached is not None and cached[0] is config_data:
+        return cached[1]
+
+    api_key = _get_st_entry_api_key(config_data, st_unique_id)
+    _ST_API_KEY_CACHE[entry.entry_id] = (config_data, api_key)
+    return api_key
+
+
+async def async_refresh_oauth_token(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> str | None:
+    """Refresh the OAuth token of an entry if stale and return the access token."""
+    lock = get_oauth_refresh_lock(entry.entry_id)
+    async with lock:
+        # Double-check after acquiring lock - token might have been refreshed
+        oauth_token = entry.data.get(CONF_OAUTH_TOKEN) or {}
+        expires_at = oauth_token.get("expires_at", 0)
+        current_time = time.time()
+        if expires_at > current_time + OAUTH_TOKEN_STALE_BUFFER:
+            _LOGGER.debug("Token was refreshed by another entity, using new token")
+            return oauth_token.get("access_token")
+
+        if "refresh_token" not in oauth_token:
             _LOGGER.warning(
-                "SmartThings: No valid token found for %s in entry data keys: %s",
-                st_unique_id,
-                list(config_data.keys())
+                "OAuth token does not contain refresh_token - token cannot be refreshed. "
+                "Please reconfigure the integration with OAuth."
             )
             return None
 
+        set_oauth_refresh_in_progress(entry.entry_id, True)
+        try:
+            _LOGGER.warning(
+                "OAuth token %s, attempting refresh",
+                "expired" if current_time > expires_at else "expiring soon"
+            )
+
+            # Try to get implementation from entry
+            implementation = None
+            try:
+                implementation = await config_entry_oauth2_flow.async_get_config_entry_implementation(
+                    hass, entry
+                )
+            except Exception as ex:
+                _LOGGER.debug("Could not get implementation from entry: %s", ex)
+
+            # If not found, try to create it directly from application credentials
+            if not implementation:
+                _LOGGER.debug("Attempting to create OAuth implementation directly")
+                try:
+                    implementations = await config_entry_oauth2_flow.async_get_implementations(
+                        hass, DOMAIN
+                    )
+                    if implementations:
+                        # Use the first available implementation
+                        implementation = list(implementations.values())[0]
+                        _LOGGER.debug("Found OAuth implementation: %s", type(implementation).__name__)
+                except Exception as impl_ex:
+                    _LOGGER.debug("Could not get implementations: %s", impl_ex)
+
+            if implementation:
+                new_token = await implementation.async_refresh_token(oauth_token)
+                # Update entry with new token, and auth_implementation for
+                # future refreshes, in a single storage write
+                hass.config_entries.async_update_entry(
+                    entry,
+                    data={
+                        **entry.data,
+                        CONF_OAUTH_TOKEN: new_token,
+                        CONF_API_KEY: new_token["access_token"],
+                        "auth_implementation": DOMAIN,
+                    },
+                )
+                _LOGGER.info("OAuth token refreshed successfully")
+                _async_arm_oauth_refresh(hass, entry, new_token)
+                return new_token["access_token"]
+
+            _LOGGER.error(
+                "Could not get OAuth implementation - Application Credentials missing. "
+                "Go to Settings > Devices & Services > Application Credentials "
+                "and add credentials for Samsung Smart TV Enhanced."
+            )
+        except Exception as ex:
+            _LOGGER.error("Failed to refresh OAuth token: %s", ex)
+        finally:
+            set_oauth_refresh_in_progress(entry.entry_id, False)
+
     return None
 
 
+@callback
+def _async_schedule_oauth_refresh(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Start a background OAuth token refresh, once per entry."""
+    if is_oauth_refresh_in_progress(entry.entry_id):
+        return
+
+    async def _async_background_refresh() -> None:
+        try:
+            await async_refresh_oauth_token(hass, entry)
+        finally:
+            set_oauth_refresh_in_progress(entry.entry_id, False)
+
+    set_oauth_refresh_in_progress(entry.entry_id, True)
+    hass.async_create_background_task(
+        _async_background_refresh(), f"{DOMAIN} OAuth token refresh"
+    )
+
+
+@callback
+def _async_arm_oauth_refresh(
+    hass: HomeAssistant, entry: ConfigEntry, oauth_token: dict
+) -> None:
+    """Schedule the next OAuth token refresh before the token becomes stale."""
+    # A refresh can finish after the entry was unloaded and its state cleared
+    if (state := _OAUTH_STATES.get(entry.entry_id)) is None or entry.state not in (
+        ConfigEntryState.LOADED,
+        ConfigEntryState.SETUP_IN_PROGRESS,
+    ):
+        return
+    if state.refresh_timer:
+        state.refresh_timer.cancel()
+        state.refresh_timer = None
+    if not (expires_at := oauth_token.get("expires_at")):
+        return
+
+    delay = max(expires_at - OAUTH_TOKEN_STALE_BUFFER - time.time(), 0)
+    state.refresh_timer = hass.loop.call_later(
+        delay, _async_schedule_oauth_refresh, hass, entry
+    )
+
+
+@callback
+def _async_clear_st_api_key_cache(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the cached SmartThings API key used by an entry."""
+    if not (st_unique_id := entry.data.get(CONF_ST_ENTRY_UNIQUE_ID)):
+        return
+    if st_entry := hass.config_entries.async_entry_for_domain_unique_id(
+        ST_DOMAIN, st_unique_id
+    ):
+        _ST_API_KEY_CACHE.pop(st_entry.entry_id, None)
+
+
+@callback
+def _async_clear_oauth_state(entry_id: str) -> None:
+    """Cancel scheduled OAuth token refresh and drop the entry state."""
+    if (state := _OAUTH_STATES.pop(entry_id, None)) and state.refresh_timer:
+        state.refresh_timer.cancel()
+
+
 async def async_get_samsungtv_api_key(hass: HomeAssistant, entry: ConfigEntry) -> str | None:
     """Get API key based on authentication method configured for this entry.
     
@@ -453,14 +721,22 @@ async def async_get_samsungtv_api_key(hass: HomeAssistant, entry: ConfigEntry) -
     # Method 1: OAuth2 - own token with refresh
     if auth_method == AUTH_METHOD_OAUTH:
         oauth_token = entry.data.get(CONF_OAUTH_TOKEN)
+        # Fast path: token already parsed and not yet in the stale window
+        cache = _OAUTH_TOKEN_CACHE.get(entry)
+        if (
+            cache is not None
+            and cache.token is oauth_token
+            and time.time() < cache.refresh_after
+        ):
+            return cache.access_token
+
         if oauth_token and isinstance(oauth_token, dict):
             access_token = oauth_token.get("access_token")
             if access_token:
-                # Check if token needs refresh (5 minutes before expiration)
                 expires_at = oauth_token.get("expires_at", 0)
                 current_time = time.time()
-                
-                if expires_at and current_time > (expires_at - 300):
+
+                if expires_at and current_time > (expires_at - OAUTH_TOKEN_STALE_BUFFER):
                     # Check if refresh_token exists
                     if "refresh_token" not in oauth_token:
                         _LOGGER.warning(
@@ -468,93 +744,30 @@ async def async_get_samsungtv_api_key(hass: HomeAssistant, entry: ConfigEntry) -
                             "Please reconfigure the integration with OAuth."
                         )
                         return access_token  # Try with expired token anyway
-                    
-                    # Check if another refresh is already in progress
-                    if is_oauth_refresh_in_progress(entry.entry_id):
-                        _LOGGER.debug("OAuth refresh already in progress, using current token")
-                        # Re-read from entry in case it was just refreshed
-                        updated_entry = hass.config_entries.async_get_entry(entry.entry_id)
-                        if updated_entry:
-                            updated_token = updated_entry.data.get(CONF_OAUTH_TOKEN, {})
-                            return updated_token.get("access_token", access_token)
+
+                    # Token still valid: refresh in background and keep using it
+                    if current_time < expires_at:
+                        _async_schedule_oauth_refresh(hass, entry)
                         return access_token
-                    
-                    # Acquire lock to prevent concurrent refresh
-                    lock = get_oauth_refresh_lock(entry.entry_id)
-                    async with lock:
-                        # Double-check after acquiring lock - token might have been refreshed
-                        updated_entry = hass.config_entries.async_get_entry(entry.entry_id)
-                        if updated_entry:
-                            updated_token = updated_entry.data.get(CONF_OAUTH_TOKEN, {})
-                            updated_expires = updated_token.get("expires_at", 0)
-                            if updated_expires > current_time + 300:
-                                _LOGGER.debug("Token was refreshed by another entity, using new token")
-                                return updated_token.get("access_token")
-                        
-                        set_oauth_refresh_in_progress(entry.entry_id, True)
-                        try:
-                            _LOGGER.warning(
-                                "OAuth token %s, attempting refresh",
-                                "expired" if current_time > expires_at else "expiring soon"
-                            )
-                            
-                            # Try to get implementation from entry
-                            implementation = None
-                            try:
-                                implementation = await config_entry_oauth2_flow.async_get_config_entry_implementation(
-                                    hass, entry
-                                )
-                            except Exception as ex:
-                                _LOGGER.debug("Could not get implementation from entry: %s", ex)
-                            
-                            # If not found, try to create it directly from application credentials
-                            if not implementation:
-                                _LOGGER.debug("Attempting to create OAuth implementation directly")
-                                try:
-                                    implementations = await config_entry_oauth2_flow.async_get_implementations(
-                                        hass, DOMAIN
-                                    )
-                                    if implementations:
-                                        # Use the first available implementation
-                                        implementation = list(implementations.values())[0]
-                                        _LOGGER.debug("Found OAuth implementation: %s", type(implementation).__name__)
-                                        
-                                        # Update entry with auth_implementation for future refreshes
-                                        if "auth_implementation" not in entry.data:
-                                            hass.config_entries.async_update_entry(
-                                                entry,
-                                                data={**entry.data, "auth_implementation": DOMAIN},
-                                            )
-                                except Exception as impl_ex:
-                                    _LOGGER.debug("Could not get implementations: %s", impl_ex)
-                            
-                            if implementation:
-                                new_token = await implementation.async_refresh_token(oauth_token)
-                                # Update entry with new token
-                                hass.config_entries.async_update_entry(
-                                    entry,
-                                    data={
-                                        **entry.data,
-                                        CONF_OAUTH_TOKEN: new_token,
-                                        CONF_API_KEY: new_token["access_token"],
-                                        "auth_implementation": DOMAIN,
-                                    },
-                                )
-                                _LOGGER.info("OAuth token refreshed successfully")
-                                return new_token["access_token"]
-                            else:
-                                _LOGGER.error(
-                                    "Could not get OAuth implementation - Application Credentials missing. "
-                                    "Go to Settings > Devices & Services > Application Credentials "
-                                    "and add credentials for Samsung Smart TV Enhanced."
-                                )
-                        except Exception as ex:
-                            _LOGGER.error("Failed to refresh OAuth token: %s", ex)
-                            # Try to use existing token anyway
-                        finally:
-                            set_oauth_refresh_in_progress(entry.entry_id, False)
-                
+
+                    # Token expired: wait for refresh
+                    if new_access_token := await async_refresh_oauth_token(
+                        hass, entry
+                    ):
+                        return new_access_token
+                    # Try to use existing token anyway
+                    return access_token
+
                 _LOGGER.debug("Using OAuth access token")
+                _OAUTH_TOKEN_CACHE[entry] = _OAuthCache(
+                    token=oauth_token,
+                    access_token=access_token,
+                    refresh_after=(
+                        expires_at - OAUTH_TOKEN_STALE_BUFFER
+                        if expires_at
+                        else float("inf")
+                    ),
+                )
                 return access_token
         
         _LOGGER.warning("OAuth method configured but no valid token found")
@@ -590,34 +803,46 @@ async def async_get_samsungtv_api_key(hass: HomeAssistant, entry: ConfigEntry) -
     return api_key
 
 
-async def _register_logo_paths(hass: HomeAssistant) -> str | None:
+def _create_logo_folder(hass: HomeAssistant) -> str | None:
+    """Create the folder for local logos if not exists."""
+    local_logo_path = Path(hass.config.path("www", f"{DOMAIN}_logos"))
+    try:
+        local_logo_path.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        _LOGGER.warning(
+            "Error registering custom logo folder %s: %s", str(local_logo_path), exc
+        )
+        return None
+    return str(local_logo_path)
+
+
+def _prepare_startup_files(
+    hass: HomeAssistant, token_hosts: dict[str, str]
+) -> tuple[str | None, dict[str, tuple[str, Path] | None]]:
+    """Create local logo folder and load old token files of entries."""
+    url_logo_path = _create_logo_folder(hass)
+    tokens = {
+        entry_id: _load_token_file(hass, hostname)
+        for entry_id, hostname in token_hosts.items()
+    }
+    return url_logo_path, tokens
+
+
+async def _register_logo_paths(hass: HomeAssistant, url_logo_path: str | None) -> None:
     """Register paths for local logos."""
 
-    static_logo_path = Path(__file__).parent / "static"
     static_paths = [
         StaticPathConfig(
-            STATIC_IMAGE_BASE_URL, str(static_logo_path), cache_headers=False
+            STATIC_IMAGE_BASE_URL, str(STATIC_LOGO_PATH), cache_headers=False
         )
     ]
 
-    local_logo_path = Path(hass.config.path("www", f"{DOMAIN}_logos"))
-    url_logo_path = str(local_logo_path)
-    if not local_logo_path.exists():
-        try:
-            local_logo_path.mkdir(parents=True)
-        except Exception as exc:  # pylint: disable=broad-except
-            _LOGGER.warning(
-                "Error registering custom logo folder %s: %s", str(local_logo_path), exc
-            )
-            url_logo_path = None
-
     if url_logo_path is not None:
         static_paths.append(
             StaticPathConfig(CUSTOM_IMAGE_BASE_URL, url_logo_path, cache_headers=False)
         )
 
     await hass.http.async_register_static_paths(static_paths)
-    return url_logo_path
 
 
 async def get_device_info(hostname: str, session: ClientSession) -> dict:
@@ -637,9 +862,10 @@ async def get_device_info(hostname: str, session: ClientSession) -> dict:
         _LOGGER.warning("Error getting HTTP device info for TV: %s", hostname)
         return {}
 
-    result = {
-        key: device[value] for key, value in DEVICE_INFO.items() if value in device
-    }
+    result = {}
+    for key, value in _DEVICE_INFO_ITEMS:
+        if value in device:
+            result[key] = device[value]
 
     if ATTR_DEVICE_ID in result:
         device_id = result[ATTR_DEVICE_ID]
@@ -660,6 +886,12 @@ class SamsungTVInfo:
         self._ws_port = 0
         self._ws_token = None
         self._ping_port = None
+        self._session = async_get_clientsession(hass)
+
+    @property
+    def session(self) -> ClientSession:
+        """Return the shared HTTP client session."""
+        return self._session
 
     @property
     def ws_port(self):
@@ -676,52 +908,60 @@ class SamsungTVInfo:
         """Return the port used to ping the TV."""
         return self._ping_port
 
-    def _try_connect_ws(self):
+    def _try_connect_ws_port(self, port: int, token: str | None, timeout: int):
+        """Try to connect to device using web sockets on a specific port."""
+        try:
+            _LOGGER.info(
+                "Try to configure SamsungTV %s using port %s%s",
+                self._hostname,
+                str(port),
+                " with existing token" if token else "",
+            )
+            with SamsungTVWS(
+                name=f"{WS_PREFIX} {self._ws_name}",  # this is the name shown in the TV
+                host=self._hostname,
+                port=port,
+                token=token,
+                timeout=timeout,
+            ) as remote:
+                remote.open()
+                return RESULT_SUCCESS, remote.token
+        except (OSError, ConnectionFailure, WebSocketException) as err:
+            _LOGGER.info(
+                "Configuration failed using port %s, error: %s", str(port), err
+            )
+        return RESULT_NOT_SUCCESSFUL, None
+
+    async def _async_try_connect_ws(self):
         """Try to connect to device using web sockets on port 8001 and 8002"""
 
-        self._ping_port = SamsungTVWS.ping_probe(self._hostname)
+        self._ping_port = await self._hass.async_add_executor_job(
+            SamsungTVWS.ping_probe, self._hostname
+        )
         if self._ping_port is None:
             _LOGGER.error(
                 "Connection to SamsungTV %s failed. Check that TV is on", self._hostname
             )
             return RESULT_NOT_SUCCESSFUL
 
+        # (port, token, timeout) for each probe, tried one at a time. The
+        # stored token goes first; the ports without token show the auth
+        # popup on the TV, so they are only tried after it failed.
+        probes = []
         if self._ws_port and self._ws_token:
-            port_list = tuple([self._ws_port, 8001, 8002])
-        else:
-            port_list = (8001, 8002)
-
-        for index, port in enumerate(port_list):
-
-            timeout = 45  # We need this high timeout because waiting for TV auth popup
-            token = None
-            if len(port_list) > 2 and index == 0:
-                timeout = DEFAULT_TIMEOUT
-                token = self._ws_token
+            probes.append((self._ws_port, self._ws_token, DEFAULT_TIMEOUT))
+        # We need this high timeout because waiting for TV auth popup
+        probes.extend((port, None, WS_AUTH_TIMEOUT) for port in (8001, 8002))
 
-            try:
-                _LOGGER.info(
-                    "Try to configure SamsungTV %s using port %s%s",
-                    self._hostname,
-                    str(port),
-                    " with existing token" if token else "",
-                )
-                with SamsungTVWS(
-                    name=f"{WS_PREFIX} {self._ws_name}",  # this is the name shown in the TV
-                    host=self._hostname,
-                    port=port,
-                    token=token,
-                    timeout=timeout,
-                ) as remote:
-                    remote.open()
-                    self._ws_token = remote.token
+        for port, token, timeout in probes:
+            result, new_token = await self._hass.async_add_executor_job(
+                self._try_connect_ws_port, port, token, timeout
+            )
+            if result == RESULT_SUCCESS:
                 _LOGGER.info("Found working configuration using port %s", str(port))
                 self._ws_port = port
+                self._ws_token = new_token
                 return RESULT_SUCCESS
-            except (OSError, ConnectionFailure, WebSocketException) as err:
-                _LOGGER.info(
-                    "Configuration failed using port %s, error: %s", str(port), err
-                )
 
         _LOGGER.error("Web socket connection to SamsungTV %s failed", self._hostname)
         return RESULT_NOT_SUCCESSFUL
@@ -770,7 +1010,6 @@ class SamsungTVInfo:
 
     async def try_connect(
         self,
-        session: ClientSession,
         api_key=None,
         st_device_id=None,
         *,
@@ -778,17 +1017,16 @@ class SamsungTVInfo:
         ws_token=None,
     ):
         """Try connect device"""
-        if session is None:
-            return RESULT_NOT_SUCCESSFUL
-
         if ws_port and ws_token:
             self._ws_port = ws_port
             self._ws_token = ws_token
 
-        result = await self._hass.async_add_executor_job(self._try_connect_ws)
+        result = await self._async_try_connect_ws()
         if result == RESULT_SUCCESS:
             if api_key and st_device_id:
-                result = await self._try_connect_st(api_key, st_device_id, session)
+                result = await self._try_connect_st(
+                    api_key, st_device_id, self._session
+                )
 
         return result
 
@@ -806,18 +1044,23 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         return True
 
     if DOMAIN in config:
-        entries_list = hass.config_entries.async_entries(DOMAIN)
+        try:
+            await async_ensure_unique_hosts(hass, config[DOMAIN])
+        except (vol.Invalid, OSError) as exc:
+            _LOGGER.error("Invalid %s configuration: %s", DOMAIN, exc)
+            return False
+
+        # reversed so that the first entry configured for a host wins
+        host_to_entry = {
+            entry.data[CONF_HOST]: entry.entry_id
+            for entry in reversed(hass.config_entries.async_entries(DOMAIN))
+        }
         for entry_config in config[DOMAIN]:
             # get ip address
             ip_address = entry_config[CONF_HOST]
 
             # check if already configured
-            valid_entries = [
-                entry.entry_id
-                for entry in entries_list
-                if entry.data[CONF_HOST] == ip_address
-            ]
-            if not valid_entries:
+            if (entry_id := host_to_entry.get(ip_address)) is None:
                 _LOGGER.warning(
                     "Found yaml configuration for not configured device %s."
                     " Please use UI to configure",
@@ -827,16 +1070,29 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
             data_yaml = {
                 key: value
-                for key, value in entry_config.items()
-                if key in SAMSMART_SCHEMA and value
+                for key in _SAMSMART_KEYS
+                if (value := entry_config.get(key))
             }
             if data_yaml:
                 if DOMAIN not in hass.data:
                     hass.data[DOMAIN] = {}
-                hass.data[DOMAIN][valid_entries[0]] = {DATA_CFG_YAML: data_yaml}
+                hass.data[DOMAIN][entry_id] = {DATA_CFG_YAML: data_yaml}
+
+    # Create local logo folder and load old token files in a single job
+    token_hosts = {
+        entry.entry_id: entry.data[CONF_HOST]
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if CONF_TOKEN not in entry.data
+    }
+    local_logo_path, pending_tokens = await hass.async_add_executor_job(
+        _prepare_startup_files, hass, token_hosts
+    )
+    if pending_tokens:
+        hass.data.setdefault(DOMAIN, {})[DATA_PENDING_TOKENS] = pending_tokens
 
     # Register path for local logo
-    if local_logo_path := await _register_logo_paths(hass):
+    await _register_logo_paths(hass, local_logo_path)
+    if local_logo_path:
         hass.data.setdefault(DOMAIN, {})[LOCAL_LOGO_PATH] = local_logo_path
 
     return True
@@ -847,46 +1103,66 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not is_valid_ha_version():
         return False
 
+    domain_data = hass.data.setdefault(DOMAIN, {})
+
+    # use old token file loaded on setup, or load it in executor while the
+    # other migrations run
+    token_info = None
+    token_load = None
+    if CONF_TOKEN not in entry.data:
+        pending_tokens = domain_data.get(DATA_PENDING_TOKENS, {})
+        if entry.entry_id in pending_tokens:
+            token_info = pending_tokens.pop(entry.entry_id)
+            if not pending_tokens:
+                domain_data.pop(DATA_PENDING_TOKENS)
+        else:
+            token_load = hass.async_add_executor_job(
+                _load_token_file, hass, entry.data[CONF_HOST]
+            )
+
     # migrate unique id to a accepted format
     _migrate_entry_unique_id(hass, entry)
 
     # migrate smartthings entry usage configuration
     _migrate_smartthings_config(hass, entry)
 
-    # migrate old token file to registry entry if required
-    if CONF_TOKEN not in entry.data:
-        await hass.async_add_executor_job(
-            _migrate_token, hass, entry, entry.data[CONF_HOST]
-        )
-
     # migrate options to new format if required
     _migrate_options_format(hass, entry)
 
+    # migrate old token file to registry entry if required
+    if token_load is not None:
+        token_info = await token_load
+    if token_info:
+        await _async_migrate_token(hass, entry, token_info)
+
     # setup entry
-    if DOMAIN not in hass.data:
-        hass.data[DOMAIN] = {}
 
     add_conf = None
-    config = entry.data.copy()
-    if entry.entry_id in hass.data[DOMAIN]:
-        add_conf = hass.data[DOMAIN][entry.entry_id].get(DATA_CFG_YAML, {})
-        for attr, value in add_conf.items():
-            if value:
-                config[attr] = value
+    if (entry_data := domain_data.get(entry.entry_id)) is not None:
+        add_conf = entry_data.get(DATA_CFG_YAML, {})
+    if add_conf:
+        config = {
+            **entry.data,
+            **{attr: value for attr, value in add_conf.items() if value},
+        }
+    else:
+        config = entry.data.copy()
 
     # setup entry
-    hass.data[DOMAIN][entry.entry_id] = {
+    entry_data = domain_data[entry.entry_id] = {
         DATA_CFG: config,
-        DATA_OPTIONS: entry.options.copy(),
+        DATA_OPTIONS: dict(entry.options) if entry.options else {},
     }
     if add_conf:
-        hass.data[DOMAIN][entry.entry_id][DATA_CFG_YAML] = add_conf
+        entry_data[DATA_CFG_YAML] = add_conf
     entry.async_on_unload(entry.add_update_listener(_update_listener))
+    entry.async_on_unload(lambda: _async_clear_oauth_state(entry.entry_id))
+    entry.async_on_unload(lambda: _async_clear_st_api_key_cache(hass, entry))
 
     # Create one shared Frame Art API before platforms are forwarded. Multiple
     # concurrent clients on com.samsung.art-app can make newer Frame TVs stop
     # routing art status responses reliably.
-    hass.data[DOMAIN][entry.entry_id][DATA_ART_API] = SamsungTVAsyncArt(
+    entry_data[DATA_ART_API] = SamsungTVAsyncArt(
         host=config[CONF_HOST],
         port=config.get(CONF_PORT, DEFAULT_PORT),
         token=config.get(CONF_TOKEN),
@@ -906,12 +1182,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(
         entry, SAMSMART_PLATFORM
     ):
-        if art_api := hass.data[DOMAIN][entry.entry_id].pop(DATA_ART_API, None):
+        domain_data = hass.data[DOMAIN]
+        entry_data = domain_data.pop(entry.entry_id)
+        if art_api := entry_data.get(DATA_ART_API):
             await art_api.close()
-        hass.data[DOMAIN][entry.entry_id].pop(DATA_CFG)
-        hass.data[DOMAIN][entry.entry_id].pop(DATA_OPTIONS)
-        if not hass.data[DOMAIN][entry.entry_id]:
-            hass.data[DOMAIN].pop(entry.entry_id)
+        # yaml configuration is only loaded on setup, keep it for entry reload
+        if add_conf := entry_data.get(DATA_CFG_YAML):
+            domain_data[entry.entry_id] = {DATA_CFG_YAML: add_conf}
 
     return unload_ok
 
@@ -919,13 +1196,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Remove a config entry."""
     await hass.async_add_executor_job(_remove_token_file, hass, entry.data[CONF_HOST])
-    if DOMAIN in hass.data:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
-        if not hass.data[DOMAIN]:
+    if (domain_data := hass.data.get(DOMAIN)) is not None:
+        domain_data.pop(entry.entry_id, None)
+        if not domain_data:
             hass.data.pop(DOMAIN)
 
 
 async def _update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update when config_entry options update."""
-    hass.data[DOMAIN][entry.entry_id][DATA_OPTIONS] = entry.options.copy()
-    async_dispatcher_send(hass, SIGNAL_CONFIG_ENTITY)
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    entry_data[DATA_OPTIONS] = dict(entry.options) if entry.options else {}
+    if options_callback := entry_data.get(DATA_OPTIONS_CALLBACK):
+        options_callback()
@@ -17,18 +17,24 @@ from __future__ import annotations
 
 import asyncio
 import base64
-from datetime import datetime
+from functools import lru_cache
+import itertools
 import json
 import logging
 import os
 import random
 import ssl
+from struct import Struct
 import time
-from typing import Any
-import uuid
+from typing import Any, BinaryIO
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
 ART_ENDPOINT = "com.samsung.art-app"
@@ -37,10 +43,61 @@ MS_CHANNEL_CONNECT_EVENT = "ms.channel.connect"
 MS_CHANNEL_READY_EVENT = "ms.channel.ready"
 MS_ERROR_EVENT = "ms.error"
 ART_WS_HEARTBEAT = 20
-
-
+# Filter and matte lists only change with firmware updates
+ART_LIST_CACHE_TTL = 3600
+ART_READY_TIMEOUT = 2
+COLOR_TEMPERATURE_RETRY = 300
+DELETE_BATCH_SIZE = 200
+DEVICE_INFO_TTL = 2.0
+REST_TIMEOUT = aiohttp.ClientTimeout(total=5)
+THUMBNAIL_BATCH_SIZE = 30
+# Stream buffer for thumbnail sockets; thumbnails are usually larger than
+# asyncio's 64 KiB default.
+THUMBNAIL_READ_LIMIT = 1 << 20
+
+# Thumbnail and upload sockets frame each JSON header with its length as a
+# 4-byte big-endian integer.
+_U32_BE = Struct(">I")
+
+_CHANNEL_OPEN_EVENTS = frozenset({MS_CHANNEL_READY_EVENT, MS_CHANNEL_CONNECT_EVENT})
+
+# Slideshow/auto rotation categories and playback types
+_CAT_IDS = {category: f"MY-C000{category}" for category in range(10)}
+_SLIDESHOW_TYPES = {True: "shuffleslideshow", False: "slideshow"}
+
+# Read-only requests without parameters that concurrent callers can share
+_SHARED_READ_REQUESTS = frozenset(
+    {
+        "get_artmode_settings",
+        "get_artmode_status",
+        "get_auto_rotation_status",
+        "get_matte_list",
+        "get_photo_filter_list",
+        "get_slideshow_status",
+    }
+)
+
+# Envelope for every art-app request sent over the websocket
+_CMD_METHOD = "ms.channel.emit"
+_CMD_EVENT = "art_app_request"
+_CMD_TO = "host"
+
+# orjson is bundled with Home Assistant; fall back to the stdlib elsewhere.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# keep catching the stdlib exception.
+_loads = orjson.loads if orjson else json.loads
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize obj to a JSON string."""
+    if orjson:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+@lru_cache(maxsize=1)
 def _get_ssl_context() -> ssl.SSLContext:
-    """Get SSL context for secure connections without blocking calls."""
+    """Get the shared non-verifying SSL context for TV connections."""
     ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
     ctx.check_hostname = False
     ctx.verify_mode = ssl.CERT_NONE
@@ -82,40 +139,100 @@ class SamsungTVAsyncArt:
         self._session: aiohttp.ClientSession | None = None
         self._timeout = timeout
         self._name = name
+        self._ws_urls: dict[int, str] = {}
         
         self._ws: aiohttp.ClientWebSocketResponse | None = None
-        self._art_uuid: str = str(uuid.uuid4())
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Request IDs only need to be unique per connection; the TV echoes
+        # them back as opaque strings.
+        self._request_ids = itertools.count(random.getrandbits(32))
+        self._art_uuid: str = self._get_uuid()
+        self._connection_id = random.getrandbits(32)
         
         # State
         self.art_mode: bool | None = None
         
         # Async handling
         self._pending_requests: dict[str, asyncio.Future] = {}
+        self._inflight: dict[tuple, asyncio.Future] = {}
         self._art_mode_broadcast_waiters: list[asyncio.Future] = []
         self._recv_task: asyncio.Task | None = None
         self._connected = False
         self._ws_lifecycle_lock = asyncio.Lock()
+        self._device_info: dict[str, Any] | None = None
+        self._device_info_ts: float = 0.0
+        self._photo_filter_cache: tuple[float, tuple] | None = None
+        self._matte_cache: tuple[float, tuple, tuple] | None = None
         self._artmode_settings_cache: list | None = None
+        self._artmode_settings_index: dict[str, dict] = {}
         self._artmode_settings_cache_ts: float = 0.0
         self._artmode_settings_cache_ttl: float = 1.5
         self._artmode_settings_lock = asyncio.Lock()
         self._supports_get_brightness: bool | None = supports_get_brightness
+        self._supports_get_color_temperature: bool | None = None
+        self._color_temperature_retry_at = 0.0
         self._capability_callback = None
 
+    def _create_future(self) -> asyncio.Future:
+        """Create a future on the loop the connection runs on."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop.create_future()
+
+    async def _single_flight(self, key: tuple, factory) -> Any:
+        """Share one in-flight read between concurrent callers with the same key."""
+        while (shared := self._inflight.get(key)) is not None:
+            try:
+                # Shield the shared result so a cancelled follower does not
+                # cancel it for the caller doing the request.
+                return await asyncio.shield(shared)
+            except asyncio.CancelledError:
+                if not shared.cancelled():
+                    raise
+                # The caller doing the request was cancelled; take over.
+
+        # The first caller runs the request inline, without an extra task.
+        shared = self._inflight[key] = self._create_future()
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            shared.cancel()
+            raise
+        except Exception as ex:
+            shared.set_exception(ex)
+            # Mark it retrieved; followers, if any, still receive it.
+            shared.exception()
+            raise
+        else:
+            shared.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def _next_connection_id(self) -> int:
+        """Return the next 32-bit d2d socket connection ID."""
+        self._connection_id = (self._connection_id + 1) & 0xFFFFFFFF
+        return self._connection_id
+
     def _get_uuid(self) -> str:
-        """Generate a new UUID for art requests."""
-        self._art_uuid = str(uuid.uuid4())
+        """Generate a new request ID for art requests."""
+        self._art_uuid = format(next(self._request_ids), "x")
         return self._art_uuid
 
     def _get_ws_url(self, port: int, *, include_token: bool = False) -> str:
         """Get the WebSocket URL for the art API."""
+        if url := self._ws_urls.get(port):
+            return url
         scheme = "wss" if port == 8002 else "ws"
         name = _serialize_string(self._name)
         # The art-app channel is unauthenticated on newer Frame firmware. Adding
         # the remote-control token can make the TV report "No Authorized" and
         # never answer Art API requests.
         token_part = ""
-        return f"{scheme}://{self._host}:{port}/api/v2/channels/{ART_ENDPOINT}?name={name}{token_part}"
+        url = self._ws_urls[port] = (
+            f"{scheme}://{self._host}:{port}/api/v2/channels/{ART_ENDPOINT}?name={name}{token_part}"
+        )
+        return url
 
     def _get_candidate_connections(self) -> list[tuple[int, bool]]:
         """Return the port/token combinations to try for the art websocket."""
@@ -144,12 +261,22 @@ class SamsungTVAsyncArt:
         if self._external_session and not self._external_session.closed:
             return self._external_session
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            # Only used outside Home Assistant, which always passes its shared
+            # session; keep REST polls to the TV on kept-alive connections.
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=10,
+                    limit_per_host=4,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                )
+            )
         return self._session
 
     async def open(self) -> bool:
         """Open WebSocket connection and start listening."""
         async with self._ws_lifecycle_lock:
+            self._loop = asyncio.get_running_loop()
             if self._ws and not self._ws.closed and self._connected:
                 return True
             if self._ws and not self._connected:
@@ -188,27 +315,24 @@ class SamsungTVAsyncArt:
 
                     # Wait for connection events
                     connected = False
-                    for _ in range(3):
+                    deadline = self._loop.time() + ART_READY_TIMEOUT
+                    while (remaining := deadline - self._loop.time()) > 0:
                         try:
-                            msg = await asyncio.wait_for(ws.receive(), timeout=2)
-                            if msg.type == aiohttp.WSMsgType.TEXT:
-                                response = json.loads(msg.data)
-                                event = response.get("event", "")
-                                _LOGGER.debug("Art API: Connection event: %s", event)
-
-                                if event == MS_CHANNEL_READY_EVENT:
-                                    connected = True
-                                    break
-                                if event == MS_CHANNEL_CONNECT_EVENT:
-                                    # 2024+ Frame firmware often sends connect
-                                    # without a separate ready event on the
-                                    # tokenless art-app channel.
-                                    connected = True
-                                    break
-                            elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
-                                break
+                            msg = await asyncio.wait_for(ws.receive(), timeout=remaining)
                         except asyncio.TimeoutError:
                             break
+                        if msg.type == aiohttp.WSMsgType.TEXT:
+                            event = _loads(msg.data).get("event", "")
+                            _LOGGER.debug("Art API: Connection event: %s", event)
+
+                            # 2024+ Frame firmware often sends connect without
+                            # a separate ready event on the tokenless art-app
+                            # channel.
+                            if event in _CHANNEL_OPEN_EVENTS:
+                                connected = True
+                                break
+                        elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                            break
 
                     if not connected:
                         auth = "tokened" if include_token else "tokenless"
@@ -290,9 +414,9 @@ class SamsungTVAsyncArt:
             async for msg in ws:
                 if msg.type == aiohttp.WSMsgType.TEXT:
                     try:
-                        response = json.loads(msg.data)
+                        response = _loads(msg.data)
                         event = response.get("event", "")
-                        await self._process_event(event, response)
+                        self._process_event(event, response)
                     except json.JSONDecodeError:
                         _LOGGER.debug("Art API: Failed to decode message")
                 elif msg.type == aiohttp.WSMsgType.ERROR:
@@ -318,9 +442,11 @@ class SamsungTVAsyncArt:
                 if self._recv_task and self._recv_task.done():
                     self._recv_task = None
 
-    async def _process_event(self, event: str, response: dict) -> None:
+    def _process_event(self, event: str, response: dict) -> None:
         """Process incoming WebSocket events."""
-        _LOGGER.debug("Art API: Received event '%s'", event)
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Art API: Received event '%s'", event)
 
         if event == MS_ERROR_EVENT:
             _LOGGER.debug("Art API: Samsung channel error: %s", response.get("data"))
@@ -334,10 +460,17 @@ class SamsungTVAsyncArt:
         if event != D2D_SERVICE_MESSAGE_EVENT:
             return
             
+        # Without a payload there is nothing to update or match.
+        if not (data_str := response.get("data")):
+            return
         try:
-            data_str = response.get("data", "{}")
-            data = json.loads(data_str) if isinstance(data_str, str) else data_str
-            _LOGGER.debug("Art API: Event data: %s", data)
+            data = (
+                _loads(data_str)
+                if isinstance(data_str, (bytes, str))
+                else data_str
+            )
+            if debug:
+                _LOGGER.debug("Art API: Event data: %s", data)
         except json.JSONDecodeError:
             return
             
@@ -364,26 +497,30 @@ class SamsungTVAsyncArt:
         
         # Resolve pending requests
         request_id = data.get("request_id", data.get("id"))
-        _LOGGER.debug(
-            "Art API: Looking for request_id='%s' or sub_event='%s' in pending: %s",
-            request_id,
-            sub_event,
-            list(self._pending_requests.keys()),
-        )
+        if debug:
+            _LOGGER.debug(
+                "Art API: Looking for request_id='%s' or sub_event='%s' in pending: %s",
+                request_id,
+                sub_event,
+                list(self._pending_requests.keys()),
+            )
         
-        # Try to match by request_id first
-        if request_id and request_id in self._pending_requests:
-            future = self._pending_requests.get(request_id)
+        # Try to match by request_id first; a matched future is removed here
+        # so a late reply cannot resolve a newer request reusing the key.
+        if request_id:
+            future = self._pending_requests.pop(request_id, None)
             if future and not future.done():
-                _LOGGER.debug("Art API: Matched by request_id '%s'", request_id)
+                if debug:
+                    _LOGGER.debug("Art API: Matched by request_id '%s'", request_id)
                 future.set_result(data)
                 return
         
         # Try to match by sub_event
-        if sub_event and sub_event in self._pending_requests:
-            future = self._pending_requests.get(sub_event)
+        if sub_event:
+            future = self._pending_requests.pop(sub_event, None)
             if future and not future.done():
-                _LOGGER.debug("Art API: Matched by sub_event '%s'", sub_event)
+                if debug:
+                    _LOGGER.debug("Art API: Matched by sub_event '%s'", sub_event)
                 future.set_result(data)
 
     async def _wait_for_response(
@@ -392,14 +529,14 @@ class SamsungTVAsyncArt:
         timeout: float = 5.0,
     ) -> dict[str, Any] | None:
         """Wait for a response matching the request key."""
-        if request_key not in self._pending_requests:
-            self._pending_requests[request_key] = asyncio.get_event_loop().create_future()
+        # _send_art_request registers its future before sending; only
+        # unsolicited events such as image_added need one created here.
+        future = self._pending_requests.get(request_key)
+        if future is None:
+            future = self._pending_requests[request_key] = self._create_future()
         
         try:
-            result = await asyncio.wait_for(
-                self._pending_requests[request_key],
-                timeout=timeout,
-            )
+            result = await asyncio.wait_for(future, timeout=timeout)
             return result
         except asyncio.TimeoutError:
             _LOGGER.debug("Art API: Timeout waiting for '%s'", request_key)
@@ -407,7 +544,9 @@ class SamsungTVAsyncArt:
         except asyncio.CancelledError:
             return None
         finally:
-            self._pending_requests.pop(request_key, None)
+            # Leave a newer registration for the same key in place
+            if self._pending_requests.get(request_key) is future:
+                del self._pending_requests[request_key]
 
     async def _send_art_request(
         self,
@@ -416,6 +555,23 @@ class SamsungTVAsyncArt:
         timeout: float = 5.0,
     ) -> dict[str, Any] | None:
         """Send an art API request and wait for response."""
+        request = request_data.get("request")
+        if request in _SHARED_READ_REQUESTS and len(request_data) == 1:
+            # Parameterless reads return the same data to every caller, so
+            # concurrent callers share one round-trip.
+            return await self._single_flight(
+                ("request", request, wait_for_event),
+                lambda: self._send_art_request_now(request_data, wait_for_event, timeout),
+            )
+        return await self._send_art_request_now(request_data, wait_for_event, timeout)
+
+    async def _send_art_request_now(
+        self,
+        request_data: dict[str, Any],
+        wait_for_event: str | None,
+        timeout: float,
+    ) -> dict[str, Any] | None:
+        """Send an art API request without sharing it with other callers."""
         # Ensure connected
         if not self._connected or not self._ws or self._ws.closed:
             if not await self.open():
@@ -433,20 +589,20 @@ class SamsungTVAsyncArt:
         request_key = wait_for_event or request_data["id"]
         
         # Create future before sending
-        self._pending_requests[request_key] = asyncio.get_event_loop().create_future()
+        self._pending_requests[request_key] = self._create_future()
         
         # Build command
         command = {
-            "method": "ms.channel.emit",
+            "method": _CMD_METHOD,
             "params": {
-                "event": "art_app_request",
-                "to": "host",
-                "data": json.dumps(request_data),
+                "event": _CMD_EVENT,
+                "to": _CMD_TO,
+                "data": _dumps(request_data),
             },
         }
         
         try:
-            await self._ws.send_json(command)
+            await self._ws.send_str(_dumps(command))
             _LOGGER.debug("Art API: Sent request '%s'", request_data.get("request", "unknown"))
             
             # Wait for response
@@ -460,17 +616,32 @@ class SamsungTVAsyncArt:
 
     # ==================== REST API Methods ====================
 
+    async def _fetch_device_info(self) -> dict[str, Any] | None:
+        """Get the REST device info, reusing a reply younger than DEVICE_INFO_TTL."""
+        if (
+            self._device_info is not None
+            and time.monotonic() - self._device_info_ts < DEVICE_INFO_TTL
+        ):
+            return self._device_info
+        return await self._single_flight(("device_info",), self._request_device_info)
+
+    async def _request_device_info(self) -> dict[str, Any] | None:
+        """Request the device info from the TV REST API."""
+        session = await self._get_session()
+        url = f"http://{self._host}:8001/api/v2/"
+        async with session.get(url, timeout=REST_TIMEOUT) as resp:
+            if resp.status != 200:
+                return None
+            data = await resp.json()
+        self._device_info = data.get("device", {})
+        self._device_info_ts = time.monotonic()
+        return self._device_info
+
     async def supported(self) -> bool:
         """Check if the TV supports Frame TV art mode."""
         try:
-            session = await self._get_session()
-            url = f"http://{self._host}:8001/api/v2/"
-            async with asyncio.timeout(5):
-                async with session.get(url) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        device = data.get("device", {})
-                        return device.get("FrameTVSupport") == "true"
+            if device := await self._fetch_device_info():
+                return device.get("FrameTVSupport") == "true"
         except Exception as ex:
             _LOGGER.debug("Art API: Error checking support: %s", ex)
         return False
@@ -478,14 +649,8 @@ class SamsungTVAsyncArt:
     async def on(self) -> bool:
         """Check if the TV is on."""
         try:
-            session = await self._get_session()
-            url = f"http://{self._host}:8001/api/v2/"
-            async with asyncio.timeout(5):
-                async with session.get(url) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        device = data.get("device", {})
-                        return device.get("PowerState", "off") == "on"
+            if device := await self._fetch_device_info():
+                return device.get("PowerState", "off") == "on"
         except Exception:
             pass
         return False
@@ -498,6 +663,10 @@ class SamsungTVAsyncArt:
 
     async def get_api_version(self) -> str | None:
         """Get the art API version."""
+        return await self._single_flight(("get_api_version",), self._get_api_version)
+
+    async def _get_api_version(self) -> str | None:
+        """Request the art API version from the TV."""
         data = await self._send_art_request({"request": "get_api_version"})
         if not data:
             data = await self._send_art_request({"request": "api_version"})
@@ -508,6 +677,12 @@ class SamsungTVAsyncArt:
         
         category: 'MY-C0002' for my pictures, 'MY-C0004' for favourites, 'MY-C0008' for store
         """
+        return await self._single_flight(
+            ("available", category), lambda: self._available(category)
+        )
+
+    async def _available(self, category: str | None) -> list:
+        """Request the artwork list from the TV."""
         data = await self._send_art_request(
             {"request": "get_content_list", "category": category},
             timeout=15,
@@ -518,7 +693,7 @@ class SamsungTVAsyncArt:
         content_list = data.get("content_list", "[]")
         if isinstance(content_list, str):
             try:
-                content_list = json.loads(content_list)
+                content_list = _loads(content_list)
             except json.JSONDecodeError:
                 return []
         
@@ -528,7 +703,10 @@ class SamsungTVAsyncArt:
 
     async def get_current(self) -> dict[str, Any] | None:
         """Get information about the currently displayed artwork."""
-        return await self._send_art_request({"request": "get_current_artwork"})
+        return await self._single_flight(
+            ("get_current",),
+            lambda: self._send_art_request({"request": "get_current_artwork"}),
+        )
 
     async def get_thumbnail_list(self, content_id_list: list[dict]) -> dict[str, bytes]:
         """Get thumbnails for a list of content IDs (multi-download)."""
@@ -540,7 +718,7 @@ class SamsungTVAsyncArt:
                 "content_id_list": content_id_list,
                 "conn_info": {
                     "d2d_mode": "socket",
-                    "connection_id": random.randrange(4 * 1024 * 1024 * 1024),
+                    "connection_id": self._next_connection_id(),
                     "id": self._get_uuid(),
                 },
             },
@@ -564,7 +742,7 @@ class SamsungTVAsyncArt:
             _LOGGER.debug("Art API: get_thumbnail_list conn_info raw: %s", conn_info)
 
             if isinstance(conn_info, str):
-                conn_info = json.loads(conn_info)
+                conn_info = _loads(conn_info)
 
             ip = conn_info.get("ip")
             port = conn_info.get("port")
@@ -587,7 +765,9 @@ class SamsungTVAsyncArt:
             )
 
             reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(ip, int(port), ssl=ssl_context),
+                asyncio.open_connection(
+                    ip, int(port), ssl=ssl_context, limit=THUMBNAIL_READ_LIMIT
+                ),
                 timeout=10,
             )
             _LOGGER.debug("Art API: Connected to thumbnail socket")
@@ -596,17 +776,18 @@ class SamsungTVAsyncArt:
                 thumbnail_data_dict: dict[str, bytes] = {}
                 total_num_thumbnails = 1
                 current_thumb = -1
+                debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
                 while current_thumb + 1 < total_num_thumbnails:
-                    _LOGGER.debug("Art API: Reading thumbnail header.")
-                    header_len = int.from_bytes(
-                        await reader.readexactly(4), "big"
-                    )
-                    _LOGGER.debug("Art API: Header length: %d", header_len)
-
+                    header_len = _U32_BE.unpack(await reader.readexactly(4))[0]
                     header_raw = await reader.readexactly(header_len)
-                    header = json.loads(header_raw)
-                    _LOGGER.debug("Art API: Thumbnail header: %s", header)
+                    header = _loads(header_raw)
+                    if debug:
+                        _LOGGER.debug(
+                            "Art API: Thumbnail header (%d bytes): %s",
+                            header_len,
+                            header,
+                        )
 
                     thumbnail_data_len = int(header["fileLength"])
                     current_thumb = int(header["num"])
@@ -616,20 +797,16 @@ class SamsungTVAsyncArt:
                         header.get("fileType", "jpg"),
                     )
 
-                    _LOGGER.debug(
-                        "Art API: Reading %d bytes for thumbnail %d/%d (%s)",
-                        thumbnail_data_len,
-                        current_thumb + 1,
-                        total_num_thumbnails,
-                        filename,
-                    )
                     thumbnail_data = await reader.readexactly(thumbnail_data_len)
                     thumbnail_data_dict[filename] = thumbnail_data
-                    _LOGGER.debug(
-                        "Art API: Got thumbnail %s (%d bytes)",
-                        filename,
-                        len(thumbnail_data),
-                    )
+                    if debug:
+                        _LOGGER.debug(
+                            "Art API: Got thumbnail %d/%d %s (%d bytes)",
+                            current_thumb + 1,
+                            total_num_thumbnails,
+                            filename,
+                            len(thumbnail_data),
+                        )
 
                 return thumbnail_data_dict
 
@@ -649,17 +826,25 @@ class SamsungTVAsyncArt:
                 ex.expected,
             )
             return {}
-        except Exception as ex:
-            _LOGGER.debug(
-                "Art API: Error getting thumbnail_list: %s (type: %s)",
-                ex,
-                type(ex).__name__,
-            )
-            import traceback
-
-            _LOGGER.debug("Art API: Traceback: %s", traceback.format_exc())
+        except Exception:
+            _LOGGER.debug("Art API: Error getting thumbnail_list", exc_info=True)
             return {}
 
+    async def get_thumbnails_batch(self, content_ids: list[str]) -> dict[str, bytes]:
+        """Get thumbnails keyed by content ID, one socket per chunk of IDs.
+
+        IDs the TV did not return are left out; callers retry them.
+        """
+        thumbnails: dict[str, bytes] = {}
+        for start in range(0, len(content_ids), THUMBNAIL_BATCH_SIZE):
+            chunk = content_ids[start : start + THUMBNAIL_BATCH_SIZE]
+            result = await self.get_thumbnail_list(
+                [{"content_id": content_id} for content_id in chunk]
+            )
+            for filename, thumbnail_data in result.items():
+                thumbnails[filename.rpartition(".")[0] or filename] = thumbnail_data
+        return thumbnails
+
 
     async def get_thumbnail(self, content_id: str) -> bytes | None:
         """Get thumbnail for a specific piece of art."""
@@ -691,7 +876,7 @@ class SamsungTVAsyncArt:
             "content_id": content_id,
             "conn_info": {
                 "d2d_mode": "socket",
-                "connection_id": random.randrange(4 * 1024 * 1024 * 1024),
+                "connection_id": self._next_connection_id(),
                 "id": self._get_uuid(),
             },
         }, timeout=10)
@@ -710,7 +895,7 @@ class SamsungTVAsyncArt:
             _LOGGER.debug("Art API: get_thumbnail conn_info: %s", conn_info)
             
             if isinstance(conn_info, str):
-                conn_info = json.loads(conn_info)
+                conn_info = _loads(conn_info)
             
             ip = conn_info.get("ip")
             port = conn_info.get("port")
@@ -723,15 +908,15 @@ class SamsungTVAsyncArt:
             
             # Connect without SSL - reference implementation doesn't use SSL for thumbnail socket
             reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(ip, int(port)),
+                asyncio.open_connection(ip, int(port), limit=THUMBNAIL_READ_LIMIT),
                 timeout=10,
             )
             
             try:
                 _LOGGER.debug("Art API: Reading thumbnail header...")
-                header_len = int.from_bytes(await reader.readexactly(4), "big")
+                header_len = _U32_BE.unpack(await reader.readexactly(4))[0]
                 _LOGGER.debug("Art API: Header length: %d", header_len)
-                header = json.loads(await reader.readexactly(header_len))
+                header = _loads(await reader.readexactly(header_len))
                 _LOGGER.debug("Art API: Thumbnail header: %s", header)
                 
                 thumbnail_len = int(header["fileLength"])
@@ -769,7 +954,7 @@ class SamsungTVAsyncArt:
                 "content_id_list": [{"content_id": content_id}],
                 "conn_info": {
                     "d2d_mode": "socket",
-                    "connection_id": random.randrange(4 * 1024 * 1024 * 1024),
+                    "connection_id": self._next_connection_id(),
                     "id": self._get_uuid(),
                 },
             },
@@ -796,7 +981,7 @@ class SamsungTVAsyncArt:
             )
 
             if isinstance(conn_info, str):
-                conn_info = json.loads(conn_info)
+                conn_info = _loads(conn_info)
 
             ip = conn_info.get("ip")
             port = conn_info.get("port")
@@ -817,7 +1002,9 @@ class SamsungTVAsyncArt:
 
             try:
                 reader, writer = await asyncio.wait_for(
-                    asyncio.open_connection(ip, int(port), ssl=ssl_context),
+                    asyncio.open_connection(
+                        ip, int(port), ssl=ssl_context, limit=THUMBNAIL_READ_LIMIT
+                    ),
                     timeout=10,
                 )
                 _LOGGER.debug("Art API: Connected successfully for %s", content_id)
@@ -835,24 +1022,18 @@ class SamsungTVAsyncArt:
                 return None
 
             try:
-                _LOGGER.debug("Art API: Reading thumbnail header for %s", content_id)
-                header_len = int.from_bytes(await reader.readexactly(4), "big")
-                _LOGGER.debug(
-                    "Art API: Header length for %s: %d", content_id, header_len
-                )
-
+                header_len = _U32_BE.unpack(await reader.readexactly(4))[0]
                 header_raw = await reader.readexactly(header_len)
-                header = json.loads(header_raw)
-                _LOGGER.debug(
-                    "Art API: Thumbnail header for %s: %s", content_id, header
-                )
+                header = _loads(header_raw)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Art API: Thumbnail header for %s (%d bytes): %s",
+                        content_id,
+                        header_len,
+                        header,
+                    )
 
                 thumbnail_len = int(header["fileLength"])
-                _LOGGER.debug(
-                    "Art API: Reading %d bytes of thumbnail data for %s",
-                    thumbnail_len,
-                    content_id,
-                )
                 thumbnail_data = await reader.readexactly(thumbnail_len)
                 _LOGGER.debug(
                     "Art API: Got thumbnail for %s (%d bytes)",
@@ -933,7 +1114,7 @@ class SamsungTVAsyncArt:
             mode = "on" if mode else "off"
         desired = mode == "on"
 
-        broadcast_future = asyncio.get_event_loop().create_future()
+        broadcast_future = self._create_future()
         self._art_mode_broadcast_waiters.append(broadcast_future)
         request_task = asyncio.ensure_future(
             self._send_art_request({
@@ -983,14 +1164,21 @@ class SamsungTVAsyncArt:
 
     async def get_photo_filter_list(self) -> list[str]:
         """Get list of available photo filters."""
+        if (cached := self._photo_filter_cache) and (
+            time.monotonic() - cached[0] < ART_LIST_CACHE_TTL
+        ):
+            return list(cached[1])
         data = await self._send_art_request({"request": "get_photo_filter_list"})
         if data:
             filter_list = data.get("filter_list", "[]")
             if isinstance(filter_list, str):
                 try:
-                    return json.loads(filter_list)
+                    filter_list = _loads(filter_list)
                 except json.JSONDecodeError:
-                    pass
+                    return []
+                if filter_list:
+                    self._photo_filter_cache = (time.monotonic(), tuple(filter_list))
+                return filter_list
         return []
 
     async def set_photo_filter(self, content_id: str, filter_id: str) -> bool:
@@ -1004,22 +1192,33 @@ class SamsungTVAsyncArt:
 
     async def get_matte_list(self, include_color: bool = False) -> list | tuple:
         """Get list of available matte types."""
+        if (cached := self._matte_cache) and (
+            time.monotonic() - cached[0] < ART_LIST_CACHE_TTL
+        ):
+            if include_color:
+                return list(cached[1]), list(cached[2])
+            return list(cached[1])
         data = await self._send_art_request({"request": "get_matte_list"})
         if data:
             matte_types = data.get("matte_type_list", "[]")
             if isinstance(matte_types, str):
                 try:
-                    matte_types = json.loads(matte_types)
+                    matte_types = _loads(matte_types)
                 except json.JSONDecodeError:
                     matte_types = []
             
+            matte_colors = data.get("matte_color_list", "[]")
+            if isinstance(matte_colors, str):
+                try:
+                    matte_colors = _loads(matte_colors)
+                except json.JSONDecodeError:
+                    matte_colors = []
+
+            if matte_types:
+                self._matte_cache = (
+                    time.monotonic(), tuple(matte_types), tuple(matte_colors)
+                )
             if include_color:
-                matte_colors = data.get("matte_color_list", "[]")
-                if isinstance(matte_colors, str):
-                    try:
-                        matte_colors = json.loads(matte_colors)
-                    except json.JSONDecodeError:
-                        matte_colors = []
                 return matte_types, matte_colors
             return matte_types
         return ([], []) if include_color else []
@@ -1060,22 +1259,28 @@ class SamsungTVAsyncArt:
                 settings_data = data.get("data", "[]")
                 if isinstance(settings_data, str):
                     try:
-                        settings_data = json.loads(settings_data)
+                        settings_data = _loads(settings_data)
                     except json.JSONDecodeError:
                         return None
                 if isinstance(settings_data, list):
                     self._artmode_settings_cache = settings_data
+                    self._artmode_settings_index = {
+                        item["item"]: item
+                        for item in reversed(settings_data)
+                        if isinstance(item, dict) and "item" in item
+                    }
                     self._artmode_settings_cache_ts = now
 
         if setting:
             if not isinstance(settings_data, list):
                 return None
-            return next((item for item in settings_data if item.get("item") == setting), None)
+            return self._artmode_settings_index.get(setting)
         return settings_data
 
     def _invalidate_artmode_settings_cache(self) -> None:
         """Drop cached Art Mode settings after a set operation."""
         self._artmode_settings_cache = None
+        self._artmode_settings_index = {}
         self._artmode_settings_cache_ts = 0.0
 
     async def get_brightness(self) -> dict | None:
@@ -1111,10 +1316,25 @@ class SamsungTVAsyncArt:
 
     async def get_color_temperature(self) -> dict | None:
         """Get current art mode color temperature."""
-        data = await self._send_art_request({"request": "get_color_temperature"})
-        if not data:
-            data = await self.get_artmode_settings("color_temperature")
-        return data
+        if (
+            self._supports_get_color_temperature is not False
+            and time.monotonic() >= self._color_temperature_retry_at
+        ):
+            data = await self._send_art_request({"request": "get_color_temperature"})
+            if data and not _is_error_response(data):
+                self._supports_get_color_temperature = True
+                return data
+            if data is not None:
+                # The TV rejected the request: read the (cached) settings
+                # list from now on.
+                self._supports_get_color_temperature = False
+            elif self._connected:
+                # No answer may be a busy TV; retry the request later.
+                self._color_temperature_retry_at = (
+                    time.monotonic() + COLOR_TEMPERATURE_RETRY
+                )
+
+        return await self.get_artmode_settings("color_temperature")
 
     async def set_color_temperature(self, value: int) -> bool:
         """Set art mode color temperature."""
@@ -1122,6 +1342,8 @@ class SamsungTVAsyncArt:
             "request": "set_color_temperature",
             "value": value,
         })
+        if data is not None and not _is_error_response(data):
+            self._invalidate_artmode_settings_cache()
         return data is not None
 
     async def get_auto_rotation_status(self) -> dict | None:
@@ -1135,11 +1357,13 @@ class SamsungTVAsyncArt:
         category: int = 2,
     ) -> bool:
         """Configure auto rotation."""
+        if category not in _CAT_IDS:
+            raise ValueError(f"Invalid slideshow category: {category}")
         data = await self._send_art_request({
             "request": "set_auto_rotation_status",
             "value": str(duration) if duration > 0 else "off",
-            "category_id": f"MY-C000{category}",
-            "type": "shuffleslideshow" if shuffle else "slideshow",
+            "category_id": _CAT_IDS[category],
+            "type": _SLIDESHOW_TYPES[bool(shuffle)],
         })
         return data is not None
 
@@ -1154,17 +1378,19 @@ class SamsungTVAsyncArt:
         category: int = 2,
     ) -> bool:
         """Configure slideshow settings."""
+        if category not in _CAT_IDS:
+            raise ValueError(f"Invalid slideshow category: {category}")
         data = await self._send_art_request({
             "request": "set_slideshow_status",
             "value": str(duration) if duration > 0 else "off",
-            "category_id": f"MY-C000{category}",
-            "type": "shuffleslideshow" if shuffle else "slideshow",
+            "category_id": _CAT_IDS[category],
+            "type": _SLIDESHOW_TYPES[bool(shuffle)],
         })
         return data is not None
 
     async def upload(
         self,
-        file: str | bytes,
+        file: str | bytes | BinaryIO,
         matte: str = "shadowbox_polar",
         portrait_matte: str = "shadowbox_polar",
         file_type: str = "png",
@@ -1173,30 +1399,43 @@ class SamsungTVAsyncArt:
         hass = None,
     ) -> str | None:
         """Upload a new image to the TV."""
-        _LOGGER.debug("Art API: Starting upload, file type: %s", type(file))
-        
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Art API: Starting upload, file type: %s", type(file))
+        loop = asyncio.get_running_loop()
+
+        def run_blocking(func, *args):
+            # Use executor to avoid blocking the event loop
+            if hass:
+                return hass.async_add_executor_job(func, *args)
+            # Fallback for non-HA usage
+            return asyncio.to_thread(func, *args)
+
+        # Files given by path or as an open binary file are streamed after the
+        # header instead of being read into memory first.
+        file_path: str | None = None
+        file_obj: BinaryIO | None = None
+        file_offset = 0
         if isinstance(file, str):
-            _LOGGER.debug("Art API: Loading file from path: %s", file)
-            file_name, file_extension = os.path.splitext(file)
-            file_type = file_extension[1:].lower()
+            _LOGGER.debug("Art API: Uploading file from path: %s", file)
+            file_path = file
+            file_type = os.path.splitext(file_path)[1][1:].lower()
             try:
-                # Use executor to avoid blocking the event loop
-                def read_file(path):
-                    with open(path, "rb") as f:
-                        return f.read()
-                
-                if hass:
-                    file = await hass.async_add_executor_job(read_file, file)
-                else:
-                    # Fallback for non-HA usage
-                    file = await asyncio.get_event_loop().run_in_executor(None, read_file, file)
-                    
-                _LOGGER.debug("Art API: File loaded, size: %d bytes", len(file))
-            except Exception as ex:
+                file_size = await run_blocking(os.path.getsize, file_path)
+            except OSError as ex:
+                _LOGGER.error("Art API: Failed to read file: %s", ex)
+                return None
+        elif isinstance(file, (bytes, bytearray, memoryview)):
+            file_size = len(file)
+        else:
+            file_obj = file
+            try:
+                file_offset = file_obj.tell()
+                file_size = file_obj.seek(0, os.SEEK_END) - file_offset
+                file_obj.seek(file_offset)
+            except (OSError, ValueError) as ex:
                 _LOGGER.error("Art API: Failed to read file: %s", ex)
                 return None
-        
-        file_size = len(file)
         if file_type == "jpeg":
             file_type = "jpg"
         
@@ -1204,7 +1443,7 @@ class SamsungTVAsyncArt:
                      file_size, file_type, matte)
         
         if date is None:
-            date = datetime.now().strftime("%Y:%m:%d %H:%M:%S")
+            date = time.strftime("%Y:%m:%d %H:%M:%S")
         
         request_id = self._get_uuid()
         _LOGGER.debug("Art API: Sending send_image request, request_id=%s", request_id)
@@ -1216,7 +1455,7 @@ class SamsungTVAsyncArt:
             "id": request_id,
             "conn_info": {
                 "d2d_mode": "socket",
-                "connection_id": random.randrange(4 * 1024 * 1024 * 1024),
+                "connection_id": self._next_connection_id(),
                 "id": request_id,
             },
             "image_date": date,
@@ -1225,7 +1464,8 @@ class SamsungTVAsyncArt:
             "file_size": file_size,
         }, timeout=15)
         
-        _LOGGER.debug("Art API: send_image response: %s", data)
+        if debug:
+            _LOGGER.debug("Art API: send_image response: %s", data)
         
         if not data:
             _LOGGER.error("Art API: No response from send_image request")
@@ -1237,18 +1477,17 @@ class SamsungTVAsyncArt:
         
         try:
             conn_info = data.get("conn_info", "{}")
-            _LOGGER.debug("Art API: Upload conn_info (raw): %s", conn_info)
-            
             if isinstance(conn_info, str):
-                conn_info = json.loads(conn_info)
+                conn_info = _loads(conn_info)
             
-            _LOGGER.debug("Art API: Upload conn_info (parsed): %s", conn_info)
+            if debug:
+                _LOGGER.debug("Art API: Upload conn_info: %s", conn_info)
             
             if not conn_info.get("ip") or not conn_info.get("port"):
                 _LOGGER.error("Art API: Invalid conn_info - missing ip or port")
                 return None
             
-            header = json.dumps({
+            header = _dumps({
                 "num": 0,
                 "total": 1,
                 "fileLength": file_size,
@@ -1256,10 +1495,15 @@ class SamsungTVAsyncArt:
                 "fileType": file_type,
                 "secKey": conn_info["key"],
                 "version": "0.0.1",
-            })
+            }).encode()
             
-            _LOGGER.debug("Art API: Connecting to %s:%s for upload (secured=%s)", 
-                         conn_info["ip"], conn_info["port"], conn_info.get("secured"))
+            if debug:
+                _LOGGER.debug(
+                    "Art API: Connecting to %s:%s for upload (secured=%s)",
+                    conn_info["ip"],
+                    conn_info["port"],
+                    conn_info.get("secured"),
+                )
             
             ssl_context = _get_ssl_context() if conn_info.get("secured") else None
             
@@ -1281,13 +1525,35 @@ class SamsungTVAsyncArt:
                 return None
             
             try:
-                _LOGGER.debug("Art API: Sending header (%d bytes)", len(header))
-                writer.write(len(header).to_bytes(4, "big"))
-                writer.write(header.encode("ascii"))
-                
-                _LOGGER.debug("Art API: Sending file data (%d bytes)", file_size)
-                writer.write(file)
-                await writer.drain()
+                _LOGGER.debug(
+                    "Art API: Sending header (%d bytes) and file data (%d bytes)",
+                    len(header),
+                    file_size,
+                )
+                header_frame = [_U32_BE.pack(len(header)), header]
+                if file_path is None and file_obj is None:
+                    writer.writelines([*header_frame, file])
+                    await writer.drain()
+                else:
+                    writer.writelines(header_frame)
+                    await writer.drain()
+                    # sendfile(2) on plain sockets; asyncio falls back to
+                    # chunked executor reads on TLS transports.
+                    if file_obj is not None:
+                        await loop.sendfile(
+                            writer.transport,
+                            file_obj,
+                            offset=file_offset,
+                            count=file_size,
+                        )
+                    else:
+                        fileobj = await run_blocking(open, file_path, "rb")
+                        try:
+                            await loop.sendfile(
+                                writer.transport, fileobj, count=file_size
+                            )
+                        finally:
+                            fileobj.close()
                 _LOGGER.debug("Art API: Data sent successfully")
             finally:
                 writer.close()
@@ -1307,8 +1573,7 @@ class SamsungTVAsyncArt:
             
         except Exception as ex:
             _LOGGER.error("Art API: Error uploading image: %s", ex)
-            import traceback
-            _LOGGER.debug("Art API: Upload traceback: %s", traceback.format_exc())
+            _LOGGER.debug("Art API: Upload error details", exc_info=True)
             return None
 
     async def delete(self, content_id: str) -> bool:
@@ -1317,11 +1582,16 @@ class SamsungTVAsyncArt:
 
     async def delete_list(self, content_ids: list[str]) -> bool:
         """Delete multiple uploaded pieces of art."""
-        content_id_list = [{"content_id": cid} for cid in content_ids]
-        await self._send_art_request({
-            "request": "delete_image_list",
-            "content_id_list": content_id_list,
-        })
+        # Large purges go out as several smaller requests the TV can handle,
+        # one at a time over the shared websocket.
+        for start in range(0, len(content_ids), DELETE_BATCH_SIZE):
+            await self._send_art_request({
+                "request": "delete_image_list",
+                "content_id_list": [
+                    {"content_id": cid}
+                    for cid in content_ids[start : start + DELETE_BATCH_SIZE]
+                ],
+            })
         return True
 
     # ==================== Context Manager ====================
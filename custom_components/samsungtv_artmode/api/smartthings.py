@@ -408,8 +408,10 @@ class SmartThingsTV:
 
         result = {}
 
+        # Let SmartThings drop non-OCF devices; the checks below still apply
         async with session.get(
             API_DEVICES,
+            params={"type": DEVICE_TYPE_OCF},
             headers=_headers(api_key),
             raise_for_status=True,
         ) as resp:
@@ -15,6 +15,7 @@ from homeassistant.components.application_credentials import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.config_entry_oauth2_flow import AbstractOAuth2Implementation
+from homeassistant.util.json import json_loads
 
 from .const import DOMAIN
 
@@ -58,7 +59,7 @@ class SmartThingsOAuth2Implementation(AuthImplementation):
         )
         if resp.status >= 400:
             try:
-                error_response = await resp.json()
+                error_response = json_loads(await resp.read())
             except (ClientError, JSONDecodeError):
                 error_response = {}
             error_code = error_response.get("error", "unknown")
@@ -71,7 +72,7 @@ class SmartThingsOAuth2Implementation(AuthImplementation):
             )
         resp.raise_for_status()
         
-        token = cast(dict, await resp.json())
+        token = cast(dict, json_loads(await resp.read()))
         
         # Always recalculate expires_at from expires_in to ensure correctness
         # SmartThings may return an incorrect expires_at or none at all
@@ -2,18 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
 import logging
-from numbers import Number
-import socket
+from types import MappingProxyType
 from typing import Any, Dict
 
+from aiohttp import ClientTimeout
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BS_DOMAIN
 from homeassistant.config_entries import (
-    SOURCE_RECONFIGURE,
-    SOURCE_REAUTH,
-    SOURCE_USER,
     ConfigEntry,
     ConfigFlowResult,
     OptionsFlow,
@@ -47,6 +46,7 @@ from homeassistant.helpers.selector import (
 
 from . import (
     SamsungTVInfo,
+    async_resolve_host,
     get_device_info,
     get_smartthings_api_key,
     get_smartthings_entries,
@@ -126,12 +126,44 @@ POWER_ON_METHODS = {
     PowerOnMethod.SmartThings.value: "SmartThings (better for wireless connection)",
 }
 
+AUTH_OPTION_OAUTH = SelectOptionDict(
+    value=AUTH_METHOD_OAUTH, label="🔐 OAuth2 (Recommended)"
+)
+AUTH_OPTION_PAT = SelectOptionDict(
+    value=AUTH_METHOD_PAT, label="🔑 Personal Access Token (PAT)"
+)
+AUTH_OPTION_ST_ENTRY = SelectOptionDict(
+    value=AUTH_METHOD_ST_ENTRY, label="🔗 Use SmartThings Integration"
+)
+
 CONF_SHOW_ADV_OPT = "show_adv_opt"
 CONF_ST_DEVICE = "st_devices"
 CONF_USE_HA_NAME = "use_ha_name_for_ws"
 CONF_AUTH_METHOD_SELECT = "auth_method"
 
-ADVANCED_OPTIONS = [
+WOL_REPEAT_VALIDATOR = vol.All(vol.Coerce(int), vol.Clamp(min=1, max=MAX_WOL_REPEAT))
+PING_PORT_VALIDATOR = vol.All(vol.Coerce(int), vol.Clamp(min=0, max=65535))
+
+# SmartThings requires these scopes
+EXTRA_AUTHORIZE_DATA = MappingProxyType({"scope": "r:devices:* x:devices:*"})
+
+HOST_SCHEMA = vol.Schema({
+    vol.Required(CONF_HOST): str,
+    vol.Required(CONF_NAME): str,
+    vol.Optional(CONF_USE_HA_NAME, default=False): bool,
+})
+STDEVICEID_SCHEMA = vol.Schema({vol.Required(CONF_DEVICE_ID): str})
+
+# Entry data keys filled from the matching device info attributes
+DEVICE_INFO_ATTRS: tuple[tuple[str, str], ...] = (
+    (CONF_ID, ATTR_DEVICE_ID),
+    (CONF_DEVICE_NAME, ATTR_DEVICE_NAME),
+    (CONF_DEVICE_MODEL, ATTR_DEVICE_MODEL),
+    (CONF_DEVICE_OS, ATTR_DEVICE_OS),
+    (CONF_MAC, ATTR_DEVICE_MAC),
+)
+
+ADVANCED_OPTIONS = frozenset({
     CONF_APP_LAUNCH_METHOD,
     CONF_DUMP_APPS,
     CONF_EXT_POWER_ENTITY,
@@ -139,24 +171,34 @@ ADVANCED_OPTIONS = [
     CONF_WOL_REPEAT,
     CONF_TOGGLE_ART_MODE,
     CONF_USE_MUTE_CHECK,
-]
+})
 
-ENUM_OPTIONS = [
+ENUM_OPTIONS = frozenset({
     CONF_APP_LOAD_METHOD,
     CONF_APP_LAUNCH_METHOD,
     CONF_LOGO_OPTION,
     CONF_POWER_ON_METHOD,
-]
+})
+
+SYNC_ENT_OPTIONS = frozenset({CONF_SYNC_TURN_OFF, CONF_SYNC_TURN_ON})
+
+# Numeric YAML types accepted as ids (bool included, as numbers.Number did)
+TV_LIST_NUMBER_TYPES = frozenset({int, float, bool})
+
+# Token validation only needs the status code, so ask for a single device.
+ST_VALIDATE_URL = "https://api.smartthings.com/v1/devices?max=1"
+ST_VALIDATE_TIMEOUT = ClientTimeout(total=10)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _get_ip(host):
+async def _async_get_ip(hass: HomeAssistant, host: str | None) -> str | None:
+    """Resolve a host name to its IPv4 address, None if it cannot be resolved."""
     if host is None:
         return None
     try:
-        return socket.gethostbyname(host)
-    except socket.gaierror:
+        return await async_resolve_host(hass, host)
+    except (OSError, UnicodeError):
         return None
 
 
@@ -189,6 +231,10 @@ class SamsungTVSmartOAuth2FlowHandler(
         self._auth_method = AUTH_METHOD_PAT
         self._oauth_data: dict | None = None
         self._reauth_entry: ConfigEntry | None = None
+        self._oauth_available: bool | None = None
+        self._ha_version_valid = is_valid_ha_version()
+        self._st_entries: dict[str, str] | None = None
+        self._st_entries_loaded = False
 
     @property
     def logger(self) -> logging.Logger:
@@ -196,10 +242,9 @@ class SamsungTVSmartOAuth2FlowHandler(
         return _LOGGER
 
     @property
-    def extra_authorize_data(self) -> dict[str, Any]:
+    def extra_authorize_data(self) -> Mapping[str, Any]:
         """Extra data to include in the authorize URL."""
-        # SmartThings requires these scopes
-        return {"scope": "r:devices:* x:devices:*"}
+        return EXTRA_AUTHORIZE_DATA
 
     def _stdev_already_used(self, devices_id) -> bool:
         """Check if a device_id is in HA config."""
@@ -210,11 +255,15 @@ class SamsungTVSmartOAuth2FlowHandler(
 
     def _remove_stdev_used(self, devices_list: Dict[str, Any]) -> Dict[str, Any]:
         """Remove entry already used."""
-        res_dev_list = devices_list.copy()
-        for dev_id in devices_list.keys():
-            if self._stdev_already_used(dev_id):
-                res_dev_list.pop(dev_id)
-        return res_dev_list
+        used_ids = {
+            entry.data.get(CONF_DEVICE_ID, "")
+            for entry in self._async_current_entries()
+        }
+        return {
+            dev_id: infos
+            for dev_id, infos in devices_list.items()
+            if dev_id not in used_ids
+        }
 
     @staticmethod
     def _extract_dev_name(device) -> str:
@@ -247,24 +296,35 @@ class SamsungTVSmartOAuth2FlowHandler(
             if len(devices_list) > 1:
                 self._st_devices_schema = self._prepare_dev_schema(devices_list)
             else:
-                self._device_id = list(devices_list.keys())[0]
+                self._device_id = next(iter(devices_list))
 
         return RESULT_SUCCESS
 
     async def _try_connect(self, *, port=None, token=None, skip_info=False) -> str:
         """Try to connect and check auth."""
         self._tv_info = SamsungTVInfo(self.hass, self._host, self._ws_name)
-        session = async_get_clientsession(self.hass)
         result = await self._tv_info.try_connect(
-            session, self._api_key, self._device_id, ws_port=port, ws_token=token
+            self._api_key, self._device_id, ws_port=port, ws_token=token
         )
         if result == RESULT_SUCCESS:
             self._token = self._tv_info.ws_token
             self._ping_port = self._tv_info.ping_port
             if not skip_info:
-                self._device_info = await get_device_info(self._host, session)
+                self._device_info = await get_device_info(
+                    self._host, self._tv_info.session
+                )
         return result
 
+    @callback
+    def _resolve_ws_name(self, user_input: dict[str, Any]) -> None:
+        """Set the websocket client name from the user input."""
+        if user_input.get(CONF_USE_HA_NAME, False):
+            ha_conf = self.hass.config
+            if hasattr(ha_conf, "location_name"):
+                self._ws_name = ha_conf.location_name
+        if not self._ws_name:
+            self._ws_name = self._name
+
     async def _validate_smartthings_token(self, api_key: str) -> bool:
         """Validate SmartThings PAT token by making a test API call."""
         if not api_key:
@@ -272,9 +332,9 @@ class SamsungTVSmartOAuth2FlowHandler(
         session = async_get_clientsession(self.hass)
         try:
             async with session.get(
-                "https://api.smartthings.com/v1/devices",
+                ST_VALIDATE_URL,
                 headers={"Authorization": f"Bearer {api_key}"},
-                timeout=10,
+                timeout=ST_VALIDATE_TIMEOUT,
             ) as resp:
                 if resp.status == 200:
                     return True
@@ -295,15 +355,26 @@ class SamsungTVSmartOAuth2FlowHandler(
                     return entry.data[CONF_API_KEY]
         return None
 
+    @callback
+    def _get_st_entries(self) -> dict[str, str] | None:
+        """Get the SmartThings integration entries, once per flow."""
+        if not self._st_entries_loaded:
+            self._st_entries = get_smartthings_entries(self.hass)
+            self._st_entries_loaded = True
+        return self._st_entries
+
     async def _async_oauth_available(self) -> bool:
         """Check if OAuth credentials are configured."""
+        if self._oauth_available is not None:
+            return self._oauth_available
         try:
             implementations = await config_entry_oauth2_flow.async_get_implementations(
                 self.hass, DOMAIN
             )
-            return bool(implementations)
+            self._oauth_available = bool(implementations)
         except Exception:
-            return False
+            self._oauth_available = False
+        return self._oauth_available
 
     # =========================================================================
     # Main flow steps
@@ -313,7 +384,7 @@ class SamsungTVSmartOAuth2FlowHandler(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle a flow initialized by the user."""
-        if not is_valid_ha_version():
+        if not self._ha_version_valid:
             return self.async_abort(
                 reason="unsupported_version",
                 description_placeholders={
@@ -323,7 +394,7 @@ class SamsungTVSmartOAuth2FlowHandler(
             )
 
         oauth_available = await self._async_oauth_available()
-        st_entries = get_smartthings_entries(self.hass)
+        st_entries = self._get_st_entries()
 
         if user_input is not None:
             self._auth_method = user_input.get(CONF_AUTH_METHOD_SELECT, AUTH_METHOD_PAT)
@@ -343,12 +414,12 @@ class SamsungTVSmartOAuth2FlowHandler(
                 return await self.async_step_manual()
 
         # Build auth method options
-        auth_options = {}
+        auth_options = []
         if oauth_available:
-            auth_options[AUTH_METHOD_OAUTH] = "🔐 OAuth2 (Recommended)"
-        auth_options[AUTH_METHOD_PAT] = "🔑 Personal Access Token (PAT)"
+            auth_options.append(AUTH_OPTION_OAUTH)
+        auth_options.append(AUTH_OPTION_PAT)
         if st_entries:
-            auth_options[AUTH_METHOD_ST_ENTRY] = "🔗 Use SmartThings Integration"
+            auth_options.append(AUTH_OPTION_ST_ENTRY)
 
         # Default to OAuth if available, otherwise PAT
         default_method = AUTH_METHOD_OAUTH if oauth_available else AUTH_METHOD_PAT
@@ -360,10 +431,7 @@ class SamsungTVSmartOAuth2FlowHandler(
                     CONF_AUTH_METHOD_SELECT, default=default_method
                 ): SelectSelector(
                     SelectSelectorConfig(
-                        options=[
-                            SelectOptionDict(value=k, label=v)
-                            for k, v in auth_options.items()
-                        ],
+                        options=auth_options,
                         mode=SelectSelectorMode.LIST,
                     )
                 ),
@@ -395,9 +463,7 @@ class SamsungTVSmartOAuth2FlowHandler(
         errors = {}
 
         if user_input is not None:
-            ip_address = await self.hass.async_add_executor_job(
-                _get_ip, user_input[CONF_HOST]
-            )
+            ip_address = await _async_get_ip(self.hass, user_input[CONF_HOST])
             if not ip_address:
                 errors["base"] = "invalid_host"
             else:
@@ -405,13 +471,7 @@ class SamsungTVSmartOAuth2FlowHandler(
                 self._host = ip_address
                 self._name = user_input[CONF_NAME]
 
-                use_ha_name = user_input.get(CONF_USE_HA_NAME, False)
-                if use_ha_name:
-                    ha_conf = self.hass.config
-                    if hasattr(ha_conf, "location_name"):
-                        self._ws_name = ha_conf.location_name
-                if not self._ws_name:
-                    self._ws_name = self._name
+                self._resolve_ws_name(user_input)
 
                 # Try to find SmartThings device
                 result = await self._get_st_deviceid()
@@ -429,11 +489,7 @@ class SamsungTVSmartOAuth2FlowHandler(
 
         return self.async_show_form(
             step_id="host",
-            data_schema=vol.Schema({
-                vol.Required(CONF_HOST): str,
-                vol.Required(CONF_NAME): str,
-                vol.Optional(CONF_USE_HA_NAME, default=False): bool,
-            }),
+            data_schema=HOST_SCHEMA,
             errors=errors if errors else None,
         )
 
@@ -449,9 +505,7 @@ class SamsungTVSmartOAuth2FlowHandler(
             return self._show_manual_form()
 
         self._user_data = user_input
-        ip_address = await self.hass.async_add_executor_job(
-            _get_ip, user_input[CONF_HOST]
-        )
+        ip_address = await _async_get_ip(self.hass, user_input[CONF_HOST])
         if not ip_address:
             return self._show_manual_form(errors="invalid_host")
 
@@ -474,13 +528,7 @@ class SamsungTVSmartOAuth2FlowHandler(
         self._api_key = api_key
         self._auth_method = AUTH_METHOD_PAT
 
-        use_ha_name = user_input.get(CONF_USE_HA_NAME, False)
-        if use_ha_name:
-            ha_conf = self.hass.config
-            if hasattr(ha_conf, "location_name"):
-                self._ws_name = ha_conf.location_name
-        if not self._ws_name:
-            self._ws_name = self._name
+        self._resolve_ws_name(user_input)
 
         result = RESULT_SUCCESS
         if self._api_key:
@@ -499,16 +547,14 @@ class SamsungTVSmartOAuth2FlowHandler(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle configuration using SmartThings integration token."""
-        st_entries = get_smartthings_entries(self.hass)
+        st_entries = self._get_st_entries()
 
         if not st_entries:
             return self.async_abort(reason="no_smartthings_integration")
 
         if user_input is not None:
             st_entry_unique_id = user_input.get("st_entry")
-            ip_address = await self.hass.async_add_executor_job(
-                _get_ip, user_input[CONF_HOST]
-            )
+            ip_address = await _async_get_ip(self.hass, user_input[CONF_HOST])
             
             if not ip_address:
                 return self.async_show_form(
@@ -591,14 +637,14 @@ class SamsungTVSmartOAuth2FlowHandler(
         if user_input is None:
             return self.async_show_form(
                 step_id="stdeviceid",
-                data_schema=vol.Schema({vol.Required(CONF_DEVICE_ID): str}),
+                data_schema=STDEVICEID_SCHEMA,
             )
 
         device_id = user_input.get(CONF_DEVICE_ID)
         if self._stdev_already_used(device_id):
             return self.async_show_form(
                 step_id="stdeviceid",
-                data_schema=vol.Schema({vol.Required(CONF_DEVICE_ID): str}),
+                data_schema=STDEVICEID_SCHEMA,
                 errors={"base": RESULT_ST_DEVICE_USED},
             )
 
@@ -607,7 +653,7 @@ class SamsungTVSmartOAuth2FlowHandler(
         if result == RESULT_ST_DEVICE_NOT_FOUND:
             return self.async_show_form(
                 step_id="stdeviceid",
-                data_schema=vol.Schema({vol.Required(CONF_DEVICE_ID): str}),
+                data_schema=STDEVICEID_SCHEMA,
                 errors={"base": result},
             )
         return await self._manage_result(result)
@@ -632,9 +678,7 @@ class SamsungTVSmartOAuth2FlowHandler(
         if user_input is None:
             return self._show_reconfigure_form()
 
-        ip_address = await self.hass.async_add_executor_job(
-            _get_ip, user_input[CONF_HOST]
-        )
+        ip_address = await _async_get_ip(self.hass, user_input[CONF_HOST])
         if not ip_address:
             return self._show_reconfigure_form(errors="invalid_host")
 
@@ -664,8 +708,9 @@ class SamsungTVSmartOAuth2FlowHandler(
         self._host = ip_address
         self._api_key = api_key
 
-        # Validate SmartThings token if provided
-        if self._api_key:
+        # Validate SmartThings token if provided. With a known device id the
+        # SmartThings health check in _try_connect already reports a bad key.
+        if self._api_key and not self._device_id:
             if not await self._validate_smartthings_token(self._api_key):
                 return self._show_reconfigure_form(errors=RESULT_WRONG_APIKEY)
 
@@ -788,13 +833,7 @@ class SamsungTVSmartOAuth2FlowHandler(
             # This is required for async_get_config_entry_implementation to work
             data["auth_implementation"] = DOMAIN
 
-        for key, attr in {
-            CONF_ID: ATTR_DEVICE_ID,
-            CONF_DEVICE_NAME: ATTR_DEVICE_NAME,
-            CONF_DEVICE_MODEL: ATTR_DEVICE_MODEL,
-            CONF_DEVICE_OS: ATTR_DEVICE_OS,
-            CONF_MAC: ATTR_DEVICE_MAC,
-        }.items():
+        for key, attr in DEVICE_INFO_ATTRS:
             if attr in self._device_info:
                 data[key] = self._device_info[attr]
 
@@ -827,7 +866,7 @@ class SamsungTVSmartOAuth2FlowHandler(
         self._error = None
 
         data = self._user_data or {}
-        st_entries = get_smartthings_entries(self.hass)
+        st_entries = self._get_st_entries()
 
         init_schema = {
             vol.Required(CONF_HOST, default=data.get(CONF_HOST, "")): str,
@@ -865,7 +904,7 @@ class SamsungTVSmartOAuth2FlowHandler(
 
         entry = self._get_reconfigure_entry()
         data = entry.data
-        st_entries = get_smartthings_entries(self.hass)
+        st_entries = self._get_st_entries()
 
         current_auth = data.get(CONF_AUTH_METHOD, AUTH_METHOD_PAT)
         auth_label = {
@@ -925,16 +964,15 @@ class OptionsFlowHandler(OptionsFlow):
         self._entry_id = config_entry.entry_id
         self._adv_chk = False
         self._std_options = config_entry.options.copy()
-        self._adv_options = {
-            key: values
-            for key, values in config_entry.options.items()
-            if key in ADVANCED_OPTIONS
-        }
-        self._sync_ent_opt = {
-            key: values
-            for key, values in config_entry.options.items()
-            if key in [CONF_SYNC_TURN_OFF, CONF_SYNC_TURN_ON]
-        }
+        self._adv_options = {}
+        self._sync_ent_opt = {}
+        # Domains providing a service, looked up once per options flow
+        self._domains_service: dict[str, tuple[str, ...]] = {}
+        for key, values in config_entry.options.items():
+            if key in SYNC_ENT_OPTIONS:
+                self._sync_ent_opt[key] = values
+            elif key in ADVANCED_OPTIONS:
+                self._adv_options[key] = values
         self._app_list = self._std_options.get(CONF_APP_LIST)
         self._channel_list = self._std_options.get(CONF_CHANNEL_LIST)
         self._source_list = self._std_options.get(CONF_SOURCE_LIST)
@@ -942,15 +980,24 @@ class OptionsFlowHandler(OptionsFlow):
         st_dev = config_entry.data.get(CONF_DEVICE_ID)
         self._use_st = api_key and st_dev
 
+    @callback
+    def _get_domains_service(self, service_name: str) -> list[str]:
+        """Return the domains that provide a service, cached for this flow."""
+        if (domains := self._domains_service.get(service_name)) is None:
+            domains = self._domains_service[service_name] = tuple(
+                _async_get_domains_service(self.hass, service_name)
+            )
+        return list(domains)
+
     @callback
     def _save_entry(self, data) -> ConfigFlowResult:
         """Save configuration options."""
-        data.update(self._adv_options)
-        data.update(self._sync_ent_opt)
-        entry_data = {k: v for k, v in data.items() if v is not None}
-        for key, value in entry_data.items():
-            if key in ENUM_OPTIONS:
-                entry_data[key] = int(value)
+        data = {**data, **self._adv_options, **self._sync_ent_opt}
+        entry_data = {
+            key: int(value) if key in ENUM_OPTIONS else value
+            for key, value in data.items()
+            if value is not None
+        }
         entry_data[CONF_APP_LIST] = self._app_list or {}
         entry_data[CONF_CHANNEL_LIST] = self._channel_list or {}
         entry_data[CONF_SOURCE_LIST] = self._source_list or {}
@@ -972,58 +1019,28 @@ class OptionsFlowHandler(OptionsFlow):
         """Return configuration form for options."""
         options = _validate_options(self._std_options)
 
-        opt_schema = {
-            vol.Required(
-                CONF_LOGO_OPTION,
-                default=options.get(CONF_LOGO_OPTION, str(LOGO_OPTION_DEFAULT.value)),
-            ): SelectSelector(_dict_to_select(LOGO_OPTIONS)),
-            vol.Required(
-                CONF_USE_LOCAL_LOGO,
-                default=options.get(CONF_USE_LOCAL_LOGO, True),
-            ): bool,
-        }
-
-        if not self._app_list:
-            opt_schema.update({
-                vol.Required(
-                    CONF_APP_LOAD_METHOD,
-                    default=options.get(
-                        CONF_APP_LOAD_METHOD, str(AppLoadMethod.All.value)
-                    ),
-                ): SelectSelector(_dict_to_select(APP_LOAD_METHODS)),
-            })
-
-        if self._use_st:
-            data_schema = vol.Schema({
-                vol.Required(
-                    CONF_USE_ST_STATUS_INFO,
-                    default=options.get(CONF_USE_ST_STATUS_INFO, True),
-                ): bool,
-                vol.Required(
-                    CONF_USE_ST_CHANNEL_INFO,
-                    default=options.get(CONF_USE_ST_CHANNEL_INFO, True),
-                ): bool,
-                vol.Required(
-                    CONF_SHOW_CHANNEL_NR,
-                    default=options.get(CONF_SHOW_CHANNEL_NR, False),
-                ): bool,
-            }).extend(opt_schema)
-            data_schema = data_schema.extend({
-                vol.Required(
-                    CONF_POWER_ON_METHOD,
-                    default=options.get(
-                        CONF_POWER_ON_METHOD, str(PowerOnMethod.WOL.value)
-                    ),
-                ): SelectSelector(_dict_to_select(POWER_ON_METHODS)),
-            })
-        else:
-            data_schema = vol.Schema(opt_schema)
-
-        if not self._adv_chk:
-            data_schema = data_schema.extend({
-                vol.Required(CONF_SHOW_ADV_OPT, default=False): bool
-            })
-
+        data_schema = self.add_suggested_values_to_schema(
+            _build_init_schema(
+                use_st=bool(self._use_st),
+                has_app_list=bool(self._app_list),
+                show_adv=not self._adv_chk,
+            ),
+            {
+                CONF_LOGO_OPTION: options.get(
+                    CONF_LOGO_OPTION, str(LOGO_OPTION_DEFAULT.value)
+                ),
+                CONF_USE_LOCAL_LOGO: options.get(CONF_USE_LOCAL_LOGO, True),
+                CONF_APP_LOAD_METHOD: options.get(
+                    CONF_APP_LOAD_METHOD, str(AppLoadMethod.All.value)
+                ),
+                CONF_USE_ST_STATUS_INFO: options.get(CONF_USE_ST_STATUS_INFO, True),
+                CONF_USE_ST_CHANNEL_INFO: options.get(CONF_USE_ST_CHANNEL_INFO, True),
+                CONF_SHOW_CHANNEL_NR: options.get(CONF_SHOW_CHANNEL_NR, False),
+                CONF_POWER_ON_METHOD: options.get(
+                    CONF_POWER_ON_METHOD, str(PowerOnMethod.WOL.value)
+                ),
+            },
+        )
         return self.async_show_form(step_id="init", data_schema=data_schema)
 
     async def async_step_menu(self, _=None):
@@ -1111,22 +1128,25 @@ class OptionsFlowHandler(OptionsFlow):
     def _async_sync_ent_form(self) -> ConfigFlowResult:
         """Return configuration form for syncronized entity."""
         select_entities = EntitySelectorConfig(
-            domain=_async_get_domains_service(self.hass, SERVICE_TURN_ON),
+            domain=self._get_domains_service(SERVICE_TURN_ON),
             exclude_entities=_async_get_entry_entities(self.hass, self._entry_id),
             multiple=True,
         )
         options = _validate_options(self._sync_ent_opt)
 
-        data_schema = vol.Schema({
-            vol.Optional(
-                CONF_SYNC_TURN_OFF,
-                description={"suggested_value": options.get(CONF_SYNC_TURN_OFF, [])},
-            ): EntitySelector(select_entities),
-            vol.Optional(
-                CONF_SYNC_TURN_ON,
-                description={"suggested_value": options.get(CONF_SYNC_TURN_ON, [])},
-            ): EntitySelector(select_entities),
-        })
+        # The selector depends on the services and entities registered now,
+        # so this schema is built per render and cannot be shared.
+        entity_selector = EntitySelector(select_entities)
+        data_schema = self.add_suggested_values_to_schema(
+            vol.Schema({
+                vol.Optional(CONF_SYNC_TURN_OFF): entity_selector,
+                vol.Optional(CONF_SYNC_TURN_ON): entity_selector,
+            }),
+            {
+                CONF_SYNC_TURN_OFF: options.get(CONF_SYNC_TURN_OFF, []),
+                CONF_SYNC_TURN_ON: options.get(CONF_SYNC_TURN_ON, []),
+            },
+        )
         return self.async_show_form(step_id="sync_ent", data_schema=data_schema)
 
     async def async_step_adv_opt(self, user_input=None) -> ConfigFlowResult:
@@ -1139,40 +1159,22 @@ class OptionsFlowHandler(OptionsFlow):
     @callback
     def _async_adv_opt_form(self) -> ConfigFlowResult:
         """Return configuration form for advanced options."""
-        select_entities = EntitySelectorConfig(domain=BS_DOMAIN)
         options = _validate_options(self._adv_options)
 
-        data_schema = vol.Schema({
-            vol.Required(
-                CONF_APP_LAUNCH_METHOD,
-                default=options.get(
+        data_schema = self.add_suggested_values_to_schema(
+            ADV_OPT_SCHEMA,
+            {
+                CONF_APP_LAUNCH_METHOD: options.get(
                     CONF_APP_LAUNCH_METHOD, str(AppLaunchMethod.Standard.value)
                 ),
-            ): SelectSelector(_dict_to_select(APP_LAUNCH_METHODS)),
-            vol.Required(
-                CONF_WOL_REPEAT,
-                default=min(options.get(CONF_WOL_REPEAT, 1), MAX_WOL_REPEAT),
-            ): vol.All(vol.Coerce(int), vol.Clamp(min=1, max=MAX_WOL_REPEAT)),
-            vol.Required(
-                CONF_PING_PORT, default=options.get(CONF_PING_PORT, 0)
-            ): vol.All(vol.Coerce(int), vol.Clamp(min=0, max=65535)),
-            vol.Optional(
-                CONF_EXT_POWER_ENTITY,
-                description={"suggested_value": options.get(CONF_EXT_POWER_ENTITY, "")},
-            ): EntitySelector(select_entities),
-            vol.Required(
-                CONF_USE_MUTE_CHECK,
-                default=options.get(CONF_USE_MUTE_CHECK, False),
-            ): bool,
-            vol.Required(
-                CONF_DUMP_APPS,
-                default=options.get(CONF_DUMP_APPS, False),
-            ): bool,
-            vol.Required(
-                CONF_TOGGLE_ART_MODE,
-                default=options.get(CONF_TOGGLE_ART_MODE, False),
-            ): bool,
-        })
+                CONF_WOL_REPEAT: min(options.get(CONF_WOL_REPEAT, 1), MAX_WOL_REPEAT),
+                CONF_PING_PORT: options.get(CONF_PING_PORT, 0),
+                CONF_EXT_POWER_ENTITY: options.get(CONF_EXT_POWER_ENTITY, ""),
+                CONF_USE_MUTE_CHECK: options.get(CONF_USE_MUTE_CHECK, False),
+                CONF_DUMP_APPS: options.get(CONF_DUMP_APPS, False),
+                CONF_TOGGLE_ART_MODE: options.get(CONF_TOGGLE_ART_MODE, False),
+            },
+        )
         return self.async_show_form(step_id="adv_opt", data_schema=data_schema)
 
 
@@ -1184,12 +1186,9 @@ def _validate_options(options: dict) -> dict:
     """Validate options format."""
     valid_options = {}
     for opt_key, opt_val in options.items():
-        if opt_key in [CONF_SYNC_TURN_OFF, CONF_SYNC_TURN_ON]:
-            if not isinstance(opt_val, list):
-                continue
         if opt_key in ENUM_OPTIONS:
             valid_options[opt_key] = str(opt_val)
-        else:
+        elif opt_key not in SYNC_ENT_OPTIONS or isinstance(opt_val, list):
             valid_options[opt_key] = opt_val
     return valid_options
 
@@ -1200,14 +1199,52 @@ def _validate_tv_list(input_list: dict[str, Any]) -> dict[str, str] | None:
     for name_val, id_val in input_list.items():
         if not id_val:
             continue
-        if isinstance(id_val, Number):
+        val_type = type(id_val)
+        if val_type in TV_LIST_NUMBER_TYPES:
             id_val = str(id_val)
-        if not isinstance(id_val, str):
+        elif val_type is not str:
             return None
         valid_list[name_val] = id_val
     return valid_list
 
 
+# Option form schemas only depend on which fields are shown; the current
+# values are applied as suggested values on each render.
+@lru_cache(maxsize=8)
+def _build_init_schema(
+    *, use_st: bool, has_app_list: bool, show_adv: bool
+) -> vol.Schema:
+    """Build the schema for the options init form."""
+    opt_schema = {
+        vol.Required(CONF_LOGO_OPTION): SelectSelector(LOGO_SELECT),
+        vol.Required(CONF_USE_LOCAL_LOGO): bool,
+    }
+
+    if not has_app_list:
+        opt_schema.update({
+            vol.Required(CONF_APP_LOAD_METHOD): SelectSelector(APP_LOAD_SELECT),
+        })
+
+    if use_st:
+        data_schema = vol.Schema({
+            vol.Required(CONF_USE_ST_STATUS_INFO): bool,
+            vol.Required(CONF_USE_ST_CHANNEL_INFO): bool,
+            vol.Required(CONF_SHOW_CHANNEL_NR): bool,
+        }).extend(opt_schema)
+        data_schema = data_schema.extend({
+            vol.Required(CONF_POWER_ON_METHOD): SelectSelector(POWER_ON_SELECT),
+        })
+    else:
+        data_schema = vol.Schema(opt_schema)
+
+    if show_adv:
+        data_schema = data_schema.extend({
+            vol.Required(CONF_SHOW_ADV_OPT, default=False): bool
+        })
+
+    return data_schema
+
+
 def _dict_to_select(opt_dict: dict) -> SelectSelectorConfig:
     """Convert a dict to a SelectSelectorConfig."""
     return SelectSelectorConfig(
@@ -1216,6 +1253,25 @@ def _dict_to_select(opt_dict: dict) -> SelectSelectorConfig:
     )
 
 
+# Select configs for the static option maps, built once at import
+APP_LAUNCH_SELECT = _dict_to_select(APP_LAUNCH_METHODS)
+APP_LOAD_SELECT = _dict_to_select(APP_LOAD_METHODS)
+LOGO_SELECT = _dict_to_select(LOGO_OPTIONS)
+POWER_ON_SELECT = _dict_to_select(POWER_ON_METHODS)
+
+ADV_OPT_SCHEMA = vol.Schema({
+    vol.Required(CONF_APP_LAUNCH_METHOD): SelectSelector(APP_LAUNCH_SELECT),
+    vol.Required(CONF_WOL_REPEAT): WOL_REPEAT_VALIDATOR,
+    vol.Required(CONF_PING_PORT): PING_PORT_VALIDATOR,
+    vol.Optional(CONF_EXT_POWER_ENTITY): EntitySelector(
+        EntitySelectorConfig(domain=BS_DOMAIN)
+    ),
+    vol.Required(CONF_USE_MUTE_CHECK): bool,
+    vol.Required(CONF_DUMP_APPS): bool,
+    vol.Required(CONF_TOGGLE_ART_MODE): bool,
+})
+
+
 def _async_get_domains_service(hass: HomeAssistant, service_name: str) -> list[str]:
     """Fetch list of domain that provide a specific service."""
     return [
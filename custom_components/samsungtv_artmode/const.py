@@ -37,8 +37,10 @@ DATA_CFG = "cfg"
 DATA_CFG_YAML = "cfg_yaml"
 DATA_OPTIONS = "options"
 DATA_ART_API = "art_api"  # Shared Frame Art API instance
+DATA_OPTIONS_CALLBACK = "options_cb"  # Entity callback for options update
 CONF_SUPPORTS_GET_BRIGHTNESS = "supports_get_brightness"
 LOCAL_LOGO_PATH = "local_logo_path"
+DATA_PENDING_TOKENS = "pending_tokens"  # Old token files loaded on setup
 WS_PREFIX = "[Home Assistant]"
 
 ATTR_DEVICE_MAC = "device_mac"
@@ -156,8 +158,6 @@ ATTR_SHUFFLE = "shuffle"
 ATTR_ENABLED = "enabled"
 ATTR_STATUS = "status"
 
-SIGNAL_CONFIG_ENTITY = f"{DOMAIN}_config"
-
 STD_APP_LIST = {
     "org.tizen.browser": {
         "st_app_id": "",
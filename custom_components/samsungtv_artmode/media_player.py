@@ -51,15 +51,14 @@ from homeassistant.const import (
 )
 from homeassistant.core import DOMAIN as HA_DOMAIN, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import config_validation as cv, entity_platform, config_entry_oauth2_flow
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.service import CONF_SERVICE_ENTITY_ID, async_call_from_config
 from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.util import Throttle, dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
-from . import get_smartthings_api_key, async_get_samsungtv_api_key, get_oauth_refresh_lock, is_oauth_refresh_in_progress, set_oauth_refresh_in_progress
+from . import get_smartthings_api_key, async_get_samsungtv_api_key, async_refresh_oauth_token
 from .api.samsungcast import SamsungCastTube
 from .api.samsungws import ArtModeStatus, SamsungTVAsyncRest, SamsungTVWS
 from .api.smartthings import SmartThingsTV, STStatus
@@ -118,6 +117,7 @@ from .const import (
     DATA_ART_API,
     DATA_CFG,
     DATA_OPTIONS,
+    DATA_OPTIONS_CALLBACK,
     DEFAULT_APP,
     DEFAULT_PORT,
     DEFAULT_SOURCE_LIST,
@@ -149,7 +149,6 @@ from .const import (
     SERVICE_SELECT_PICTURE_MODE,
     SERVICE_SMARTTHINGS_GET_STATUS,
     SERVICE_SMARTTHINGS_SEND_COMMAND,
-    SIGNAL_CONFIG_ENTITY,
     STD_APP_LIST,
     WS_PREFIX,
     AppLaunchMethod,
@@ -183,6 +182,8 @@ MEDIA_TYPE_TEXT = "send_text"
 POWER_OFF_DELAY = 20
 ST_APP_SEPARATOR = "/"
 ST_UPDATE_TIMEOUT = 5
+# Thumbnails missed by a batch fetch that are downloaded at the same time
+THUMBNAIL_RETRY_CONCURRENCY = 4
 
 YT_APP_IDS = ("111299001912", "9Ur5IzDKqV.TizenYouTube")
 YT_VIDEO_QS = "v"
@@ -207,7 +208,6 @@ SUPPORT_SAMSUNGTV_SMART = (
 
 MIN_TIME_BETWEEN_ST_UPDATE = timedelta(seconds=5)
 ST_API_KEY_UPDATE_INTERVAL = timedelta(minutes=30)
-OAUTH_TOKEN_REFRESH_BUFFER = 300  # Refresh OAuth token 5 minutes before expiration
 SCAN_INTERVAL = timedelta(seconds=15)
 
 _LOGGER = logging.getLogger(__name__)
@@ -676,159 +676,32 @@ class SamsungTVDevice(SamsungTVEntity, MediaPlayerEntity):
         """
         if self._auth_method != AUTH_METHOD_OAUTH:
             return True
-        
-        # Check if another refresh is already in progress (global check)
-        if is_oauth_refresh_in_progress(self._entry_id):
-            _LOGGER.debug("OAuth refresh already in progress (global), waiting for result")
-            # Wait a bit and then check if token was refreshed
-            await asyncio.sleep(0.5)
-            # Re-read token from entry
-            entry = self.hass.config_entries.async_get_entry(self._entry_id)
-            if entry:
-                oauth_token = entry.data.get(CONF_OAUTH_TOKEN, {})
-                new_token = oauth_token.get("access_token")
-                if new_token and new_token != self._st_api_key:
-                    self._st_api_key = new_token
-                    if self._st:
-                        self._st._api_key = new_token
-                    return True
-            return False
-        
-        # Acquire global lock
-        lock = get_oauth_refresh_lock(self._entry_id)
-        async with lock:
-            # Double-check after acquiring lock - another entity might have refreshed
-            entry = self.hass.config_entries.async_get_entry(self._entry_id)
-            if entry:
-                oauth_token = entry.data.get(CONF_OAUTH_TOKEN, {})
-                expires_at = oauth_token.get("expires_at", 0)
-                if expires_at > time.time() + OAUTH_TOKEN_REFRESH_BUFFER:
-                    # Token was refreshed by another entity
-                    new_token = oauth_token.get("access_token")
-                    if new_token and new_token != self._st_api_key:
-                        _LOGGER.debug("Token was refreshed by another entity, using new token")
-                        self._st_api_key = new_token
-                        if self._st:
-                            self._st._api_key = new_token
-                    return True
-            
-            set_oauth_refresh_in_progress(self._entry_id, True)
-            try:
-                return await self._do_oauth_refresh()
-            finally:
-                set_oauth_refresh_in_progress(self._entry_id, False)
-    
-    async def _do_oauth_refresh(self) -> bool:
-        """Perform the actual OAuth token refresh."""
-        # Get current entry to check token expiration
+
         entry = self.hass.config_entries.async_get_entry(self._entry_id)
         if not entry:
             _LOGGER.warning("Could not find config entry for OAuth refresh")
             return False
-            
-        oauth_token = entry.data.get(CONF_OAUTH_TOKEN)
-        if not oauth_token or not isinstance(oauth_token, dict):
-            _LOGGER.warning("No OAuth token found in config entry")
-            return False
-        
-        # Check if refresh_token exists
-        if "refresh_token" not in oauth_token:
-            _LOGGER.warning(
-                "OAuth token does not contain refresh_token - token cannot be refreshed. "
-                "Please reconfigure the integration with OAuth."
-            )
+
+        # Shared with the background refresh: waits for one already running
+        if not (new_token := await async_refresh_oauth_token(self.hass, entry)):
             return False
-            
-        expires_at = oauth_token.get("expires_at", 0)
-        current_time = time.time()
-        
-        # Check if token needs refresh (within buffer period before expiration)
-        if expires_at and current_time < (expires_at - OAUTH_TOKEN_REFRESH_BUFFER):
-            # Token still valid, no refresh needed
-            return True
-        
-        # Token is expiring or expired
-        time_until_expiry = expires_at - current_time if expires_at else 0
-        _LOGGER.warning(
-            "OAuth token %s (expires in %.0f seconds), attempting refresh",
-            "expired" if time_until_expiry <= 0 else "expiring soon",
-            time_until_expiry
-        )
-        
-        try:
-            # Try to get implementation from entry
-            implementation = None
-            try:
-                implementation = await config_entry_oauth2_flow.async_get_config_entry_implementation(
-                    self.hass, entry
-                )
-            except Exception as ex:
-                _LOGGER.debug("Could not get implementation from entry: %s", ex)
-            
-            # If not found, try to get it directly from available implementations
-            if not implementation:
-                _LOGGER.debug("Attempting to get OAuth implementation directly")
-                try:
-                    implementations = await config_entry_oauth2_flow.async_get_implementations(
-                        self.hass, DOMAIN
-                    )
-                    if implementations:
-                        # Use the first available implementation
-                        implementation = list(implementations.values())[0]
-                        _LOGGER.debug("Found OAuth implementation: %s", type(implementation).__name__)
-                except Exception as impl_ex:
-                    _LOGGER.debug("Could not get implementations: %s", impl_ex)
-            
-            if not implementation:
-                _LOGGER.error(
-                    "Could not get OAuth implementation - Application Credentials may be missing. "
-                    "Go to Settings > Devices & Services > Application Credentials "
-                    "and add credentials for Samsung Smart TV Enhanced, then reconfigure the integration."
-                )
-                return False
-                
-            new_token = await implementation.async_refresh_token(oauth_token)
-            
-            # Update config entry with new token and auth_implementation
-            self.hass.config_entries.async_update_entry(
-                entry,
-                data={
-                    **entry.data,
-                    CONF_OAUTH_TOKEN: new_token,
-                    CONF_API_KEY: new_token["access_token"],
-                    "auth_implementation": DOMAIN,
-                },
-            )
-            
-            # Update local api key
-            self._st_api_key = new_token["access_token"]
-            
+
+        if new_token != self._st_api_key:
+            self._st_api_key = new_token
             # Update SmartThingsTV directly (callback is disabled for OAuth)
             if self._st:
-                self._st._api_key = self._st_api_key
+                self._st._api_key = new_token
                 _LOGGER.debug("Updated SmartThingsTV with new OAuth token")
-                
-            _LOGGER.info("OAuth token refreshed successfully, new expiration in %.0f seconds", 
-                        new_token.get("expires_at", 0) - time.time())
-            return True
-            
-        except Exception as ex:
-            _LOGGER.error(
-                "Failed to refresh OAuth token: %s. "
-                "You may need to reconfigure the integration with OAuth.",
-                ex
-            )
-            return False
+        return True
 
     async def async_added_to_hass(self):
         """Set config parameter when add to hass."""
         await super().async_added_to_hass()
 
         # this will update config options when changed
+        self._entry_data[DATA_OPTIONS_CALLBACK] = self._update_config_options
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass, SIGNAL_CONFIG_ENTITY, self._update_config_options
-            )
+            lambda: self._entry_data.pop(DATA_OPTIONS_CALLBACK, None)
         )
 
         def update_status_callback():
@@ -2927,6 +2800,19 @@ class SamsungTVDevice(SamsungTVEntity, MediaPlayerEntity):
             _LOGGER.error("Error deleting artwork: %s", ex)
             return {"error": str(ex)}
 
+    def _thumbnail_target(self, content_id: str) -> tuple[str, str, str, str]:
+        """Return subdirectory, directory, file name and path for a thumbnail."""
+        # Determine subdirectory and file path based on content type
+        if content_id.startswith("MY_F"):
+            subdir = "personal"
+        elif content_id.startswith("SAM-"):
+            subdir = "store"
+        else:
+            subdir = "other"
+        www_path = self.hass.config.path("www", "frame_art", subdir)
+        file_name = f"{content_id.replace(':', '_')}.jpg"
+        return subdir, www_path, file_name, os.path.join(www_path, file_name)
+
     async def async_art_get_thumbnail(self, content_id: str, save_to_file: bool = True, force_download: bool = False) -> dict:
         """Get thumbnail for a specific piece of artwork.
         
@@ -2944,20 +2830,7 @@ class SamsungTVDevice(SamsungTVEntity, MediaPlayerEntity):
             return result
         
         try:
-            import os
-            
-            # Determine subdirectory and file path based on content type
-            if content_id.startswith("MY_F"):
-                subdir = "personal"
-            elif content_id.startswith("SAM-"):
-                subdir = "store"
-            else:
-                subdir = "other"
-            
-            # Create directory path
-            www_path = self.hass.config.path("www", "frame_art", subdir)
-            file_name = f"{content_id.replace(':', '_')}.jpg"
-            file_path = os.path.join(www_path, file_name)
+            subdir, www_path, file_name, file_path = self._thumbnail_target(content_id)
             
             # Check if file already exists (unless force_download=True)
             if save_to_file and not force_download:
@@ -3217,49 +3090,132 @@ class SamsungTVDevice(SamsungTVEntity, MediaPlayerEntity):
             
             _LOGGER.info("Starting batch thumbnail download for %d artworks (force_download=%s, cleanup_orphans=%s)", total, force_download, cleanup_orphans)
             
-            for idx, artwork in enumerate(artwork_list, 1):
-                content_id = artwork.get("content_id")
-                if not content_id:
-                    continue
-                
-                try:
-                    _LOGGER.debug("Processing thumbnail %d/%d: %s", idx, total, content_id)
-                    
-                    # Download with file existence check (unless force_download)
-                    result = await self.async_art_get_thumbnail(
-                        content_id, 
-                        save_to_file=True, 
-                        force_download=force_download
+            content_ids = [
+                content_id
+                for artwork in artwork_list
+                if (content_id := artwork.get("content_id"))
+            ]
+            targets = {
+                content_id: self._thumbnail_target(content_id)
+                for content_id in content_ids
+            }
+
+            def _missing_thumbnails() -> list[str]:
+                return [
+                    content_id
+                    for content_id in content_ids
+                    if not os.path.isfile(targets[content_id][3])
+                ]
+
+            if force_download:
+                pending = content_ids
+            else:
+                pending = await self.hass.async_add_executor_job(_missing_thumbnails)
+                pending_ids = set(pending)
+                for content_id in content_ids:
+                    if content_id in pending_ids:
+                        continue
+                    subdir, _, file_name, file_path = targets[content_id]
+                    skipped.append({
+                        "content_id": content_id,
+                        "url": f"/local/frame_art/{subdir}/{file_name}",
+                        "path": file_path,
+                        "subdirectory": subdir,
+                        "reason": "Already exists"
+                    })
+
+            # Fetch everything missing over a few shared sockets first; only
+            # the thumbnails the TV did not return go through the per-image
+            # path with its retries.
+            fetched = (
+                await self._art_api.get_thumbnails_batch(pending) if pending else {}
+            )
+
+            def _write_thumbnails() -> dict[str, int]:
+                written = {}
+                for content_id in pending:
+                    if not (thumbnail_data := fetched.get(content_id)):
+                        continue
+                    _, www_path, _, file_path = targets[content_id]
+                    try:
+                        os.makedirs(www_path, exist_ok=True)
+                        with open(file_path, "wb") as f:
+                            f.write(thumbnail_data)
+                    except OSError as ex:
+                        _LOGGER.warning("Could not save thumbnail to file: %s", ex)
+                        continue
+                    written[content_id] = len(thumbnail_data)
+                return written
+
+            written = (
+                await self.hass.async_add_executor_job(_write_thumbnails)
+                if fetched
+                else {}
+            )
+
+            # Thumbnails the batch did not return are independent, so retry
+            # them individually in parallel, a few at a time.
+            retry_ids = [
+                content_id for content_id in pending if content_id not in written
+            ]
+            retry_semaphore = asyncio.Semaphore(THUMBNAIL_RETRY_CONCURRENCY)
+
+            async def _retry_thumbnail(content_id: str) -> dict:
+                async with retry_semaphore:
+                    _LOGGER.debug("Retrying thumbnail download for %s", content_id)
+                    return await self.async_art_get_thumbnail(
+                        content_id,
+                        save_to_file=True,
+                        force_download=True
                     )
-                    
-                    if "error" in result:
-                        failed.append({
-                            "content_id": content_id,
-                            "error": result.get("error")
-                        })
-                    elif result.get("cached"):
-                        skipped.append({
-                            "content_id": content_id,
-                            "url": result.get("thumbnail_url"),
-                            "path": result.get("thumbnail_path"),
-                            "subdirectory": result.get("subdirectory"),
-                            "reason": "Already exists"
-                        })
-                    else:
-                        downloaded.append({
-                            "content_id": content_id,
-                            "url": result.get("thumbnail_url"),
-                            "path": result.get("thumbnail_path"),
-                            "subdirectory": result.get("subdirectory"),
-                            "size": result.get("size")
-                        })
-                    
-                    # Shorter delay between downloads
-                    await asyncio.sleep(0.05)
-                    
-                except Exception as ex:
-                    _LOGGER.warning("Failed to process thumbnail for %s: %s", content_id, ex)
-                    failed.append({"content_id": content_id, "error": str(ex)})
+
+            retried = dict(
+                zip(
+                    retry_ids,
+                    await asyncio.gather(
+                        *(_retry_thumbnail(content_id) for content_id in retry_ids),
+                        return_exceptions=True,
+                    ),
+                )
+            )
+
+            for content_id in pending:
+                if content_id in written:
+                    subdir, _, file_name, file_path = targets[content_id]
+                    downloaded.append({
+                        "content_id": content_id,
+                        "url": f"/local/frame_art/{subdir}/{file_name}",
+                        "path": file_path,
+                        "subdirectory": subdir,
+                        "size": written[content_id]
+                    })
+                    continue
+
+                result = retried[content_id]
+                if isinstance(result, Exception):
+                    _LOGGER.warning("Failed to process thumbnail for %s: %s", content_id, result)
+                    failed.append({"content_id": content_id, "error": str(result)})
+                elif "error" in result:
+                    failed.append({
+                        "content_id": content_id,
+                        "error": result.get("error")
+                    })
+                elif result.get("cached"):
+                    skipped.append({
+                        "content_id": content_id,
+                        "url": result.get("thumbnail_url"),
+                        "path": result.get("thumbnail_path"),
+                        "subdirectory": result.get("subdirectory"),
+                        "reason": "Already exists"
+                    })
+                else:
+                    downloaded.append({
+                        "content_id": content_id,
+                        "url": result.get("thumbnail_url"),
+                        "path": result.get("thumbnail_path"),
+                        "subdirectory": result.get("subdirectory"),
+                        "size": result.get("size")
+                    })
             
             # Build summary with metadata
             result = {
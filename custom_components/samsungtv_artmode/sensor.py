@@ -373,22 +373,30 @@ class FrameArtCoordinator(DataUpdateCoordinator):
                 except Exception as ex:
                     _LOGGER.debug("Error getting art mode: %s", ex)
             
-            # Get current artwork with timeout
+            # Current artwork, artwork count (only if art_mode is on) and
+            # slideshow status are independent; the Art API matches replies by
+            # request ID, so fetch them concurrently.
+            fetches = [
+                self._async_art_fetch("current artwork", self._art_api.get_current, 8),
+                self._async_art_fetch(
+                    "slideshow status", self._art_api.get_slideshow_status, 8
+                ),
+            ]
+            if data["art_mode"] == "on":
+                fetches.append(
+                    self._async_art_fetch("artwork list", self._art_api.available, 15)
+                )
+            current, slideshow, *rest = await asyncio.gather(*fetches)
+            artwork_list = rest[0] if rest else None
+
             content_id = None
-            try:
-                async with asyncio.timeout(8):
-                    current = await self._art_api.get_current()
-                    if current:
-                        content_id = current.get("content_id")
-                        data["current_artwork"] = {
-                            "content_id": content_id,
-                            "category_id": current.get("category_id"),
-                            "matte_id": current.get("matte_id"),
-                        }
-            except asyncio.TimeoutError:
-                _LOGGER.debug("Timeout getting current artwork")
-            except Exception as ex:
-                _LOGGER.debug("Error getting current artwork: %s", ex)
+            if current:
+                content_id = current.get("content_id")
+                data["current_artwork"] = {
+                    "content_id": content_id,
+                    "category_id": current.get("category_id"),
+                    "matte_id": current.get("matte_id"),
+                }
             
             # Only fetch thumbnail if:
             # - Thumbnail fetching is enabled
@@ -424,27 +432,11 @@ class FrameArtCoordinator(DataUpdateCoordinator):
             if self._has_current_thumbnail():
                 data["current_thumbnail_url"] = "/local/frame_art/current.jpg"
             
-            # Get artwork count (less frequently, only if art_mode is on)
-            if data["art_mode"] == "on":
-                try:
-                    async with asyncio.timeout(15):
-                        artwork_list = await self._art_api.available()
-                        data["artwork_count"] = len(artwork_list) if artwork_list else 0
-                except asyncio.TimeoutError:
-                    _LOGGER.debug("Timeout getting artwork list")
-                except Exception as ex:
-                    _LOGGER.debug("Error getting artwork list: %s", ex)
+            if artwork_list is not None:
+                data["artwork_count"] = len(artwork_list)
             
-            # Get slideshow status with timeout
-            try:
-                async with asyncio.timeout(8):
-                    slideshow = await self._art_api.get_slideshow_status()
-                    if slideshow:
-                        data["slideshow_status"] = slideshow.get("value", "off")
-            except asyncio.TimeoutError:
-                _LOGGER.debug("Timeout getting slideshow status")
-            except Exception as ex:
-                _LOGGER.debug("Error getting slideshow status: %s", ex)
+            if slideshow:
+                data["slideshow_status"] = slideshow.get("value", "off")
                 
         except Exception as ex:
             # Track connection failures to prevent infinite reconnection loops
@@ -514,6 +506,17 @@ class FrameArtCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("Could not check media_player power state: %s", ex)
         return False
 
+    async def _async_art_fetch(self, name: str, request, timeout: float) -> Any:
+        """Run one Art API read with a timeout, returning None on failure."""
+        try:
+            async with asyncio.timeout(timeout):
+                return await request()
+        except asyncio.TimeoutError:
+            _LOGGER.debug("Timeout getting %s", name)
+        except Exception as ex:
+            _LOGGER.debug("Error getting %s: %s", name, ex)
+        return None
+
     def _get_media_player_art_mode(self) -> str | None:
         """Get Art Mode status from the linked media_player entity."""
         try:
@@ -5,11 +5,14 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from pathlib import Path
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 import aiohttp
 import pytest
 
+from custom_components.samsungtv_artmode.api import art as art_api
 from custom_components.samsungtv_artmode.api.art import (
     D2D_SERVICE_MESSAGE_EVENT,
     MS_CHANNEL_CONNECT_EVENT,
@@ -112,7 +115,7 @@ async def test_open_logs_one_warning_after_all_ports_fail(
 async def test_get_artmode_matches_artmode_status_event() -> None:
     """get_artmode_status replies are keyed by event name on some TVs."""
     ws = MagicMock(closed=False)
-    ws.send_json = AsyncMock()
+    ws.send_str = AsyncMock()
 
     art = SamsungTVAsyncArt("192.168.1.38")
     art._connected = True
@@ -121,7 +124,7 @@ async def test_get_artmode_matches_artmode_status_event() -> None:
     task = asyncio.create_task(art.get_artmode())
     await asyncio.sleep(0)
 
-    await art._process_event(
+    art._process_event(
         D2D_SERVICE_MESSAGE_EVENT,
         {
             "data": json.dumps(
@@ -141,7 +144,7 @@ async def test_get_artmode_matches_artmode_status_event() -> None:
 async def test_set_artmode_does_not_treat_ms_error_as_success() -> None:
     """Samsung channel errors should unblock the call but still fail."""
     ws = MagicMock(closed=False)
-    ws.send_json = AsyncMock()
+    ws.send_str = AsyncMock()
 
     art = SamsungTVAsyncArt("192.168.1.38")
     art._connected = True
@@ -150,9 +153,291 @@ async def test_set_artmode_does_not_treat_ms_error_as_success() -> None:
     task = asyncio.create_task(art.set_artmode(True))
     await asyncio.sleep(0)
 
-    await art._process_event(
+    art._process_event(
         MS_ERROR_EVENT,
         {"event": MS_ERROR_EVENT, "data": {"message": "can't find which Channel I'm in"}},
     )
 
     assert await task is False
+
+
+def _connected_art(host: str = "192.168.1.38") -> SamsungTVAsyncArt:
+    """Return an art client with an open mocked websocket."""
+    ws = MagicMock(closed=False)
+    ws.send_str = AsyncMock()
+
+    art = SamsungTVAsyncArt(host)
+    art._connected = True
+    art._ws = ws
+    return art
+
+
+def _sent_requests(art: SamsungTVAsyncArt) -> list[dict]:
+    """Return the art-app requests sent over the mocked websocket."""
+    return [
+        json.loads(json.loads(call.args[0])["params"]["data"])
+        for call in art._ws.send_str.await_args_list
+    ]
+
+
+async def _wait_until(predicate) -> None:
+    """Yield to the loop until the predicate holds."""
+    async with asyncio.timeout(5):
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_get_thumbnails_batch_requests_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Batch thumbnails should be fetched per chunk and keyed by content ID."""
+    monkeypatch.setattr(art_api, "THUMBNAIL_BATCH_SIZE", 2)
+    art = _connected_art()
+    art.get_thumbnail_list = AsyncMock(
+        side_effect=[{"MY_F0001.jpg": b"one"}, {"MY_F0003.png": b"three"}]
+    )
+
+    thumbnails = await art.get_thumbnails_batch(["MY_F0001", "MY_F0002", "MY_F0003"])
+
+    # MY_F0002 was not returned and is left for the caller to retry
+    assert thumbnails == {"MY_F0001": b"one", "MY_F0003": b"three"}
+    assert [call.args[0] for call in art.get_thumbnail_list.await_args_list] == [
+        [{"content_id": "MY_F0001"}, {"content_id": "MY_F0002"}],
+        [{"content_id": "MY_F0003"}],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_available_calls_share_one_request() -> None:
+    """Concurrent artwork list reads for one category should share a request."""
+    art = _connected_art()
+
+    first = asyncio.create_task(art.available("MY-C0002"))
+    second = asyncio.create_task(art.available("MY-C0002"))
+    await asyncio.sleep(0)
+
+    request = _sent_requests(art)[0]
+    art._process_event(
+        D2D_SERVICE_MESSAGE_EVENT,
+        {
+            "data": json.dumps(
+                {
+                    "event": "content_list",
+                    "request_id": request["id"],
+                    "content_list": json.dumps(
+                        [
+                            {"content_id": "MY_F0001", "category_id": "MY-C0002"},
+                            {"content_id": "SAM-S0001", "category_id": "MY-C0004"},
+                        ]
+                    ),
+                }
+            )
+        },
+    )
+
+    expected = [{"content_id": "MY_F0001", "category_id": "MY-C0002"}]
+    assert await first == expected
+    assert await second == expected
+    assert art._ws.send_str.await_count == 1
+    assert not art._inflight
+
+
+@pytest.mark.asyncio
+async def test_wait_for_response_drops_future_on_timeout() -> None:
+    """A timed out wait should not leave its future registered."""
+    art = _connected_art()
+
+    assert await art._wait_for_response("image_added", timeout=0.01) is None
+    assert "image_added" not in art._pending_requests
+
+
+@pytest.mark.asyncio
+async def test_wait_for_response_keeps_newer_registration() -> None:
+    """A cancelled wait should not remove a newer future for the same key."""
+    art = _connected_art()
+
+    task = asyncio.create_task(art._wait_for_response("image_added"))
+    await asyncio.sleep(0)
+    newer = art._pending_requests["image_added"] = asyncio.get_running_loop().create_future()
+
+    task.cancel()
+    assert await task is None
+    assert art._pending_requests["image_added"] is newer
+
+
+@pytest.mark.asyncio
+async def test_upload_streams_file_with_sendfile(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Uploads from a path should send the header, then stream the file."""
+    payload = bytes(range(256)) * 1024
+    image = tmp_path / "art.png"
+    image.write_bytes(payload)
+
+    writer = MagicMock()
+    writer.drain = AsyncMock()
+    writer.wait_closed = AsyncMock()
+    open_connection = AsyncMock(return_value=(MagicMock(), writer))
+    monkeypatch.setattr(asyncio, "open_connection", open_connection)
+
+    streamed = bytearray()
+
+    async def sendfile(transport, file, offset=0, count=None):
+        assert transport is writer.transport
+        file.seek(offset)
+        streamed.extend(file.read(count))
+        return count
+
+    loop = asyncio.get_running_loop()
+    monkeypatch.setattr(loop, "sendfile", AsyncMock(side_effect=sendfile))
+
+    art = _connected_art()
+    task = asyncio.create_task(art.upload(str(image)))
+    await _wait_until(lambda: art._ws.send_str.await_count)
+
+    request = _sent_requests(art)[0]
+    assert request["request"] == "send_image"
+    assert request["file_size"] == len(payload)
+
+    art._process_event(
+        D2D_SERVICE_MESSAGE_EVENT,
+        {
+            "data": json.dumps(
+                {
+                    "event": "ready_to_use",
+                    "request_id": request["id"],
+                    "conn_info": json.dumps(
+                        {"ip": "192.168.1.38", "port": 37001, "key": "key"}
+                    ),
+                }
+            )
+        },
+    )
+    await _wait_until(lambda: "image_added" in art._pending_requests)
+    art._process_event(
+        D2D_SERVICE_MESSAGE_EVENT,
+        {"data": json.dumps({"event": "image_added", "content_id": "MY_F0001"})},
+    )
+
+    assert await task == "MY_F0001"
+
+    assert open_connection.await_args.args[:2] == ("192.168.1.38", 37001)
+    header_len, header = writer.writelines.call_args.args[0]
+    assert art_api._U32_BE.unpack(header_len)[0] == len(header)
+    header = json.loads(header)
+    assert header["secKey"] == "key"
+    assert header["fileType"] == "png"
+    assert header["fileLength"] == len(payload)
+    assert streamed == payload
+    loop.sendfile.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_list_sends_batches_sequentially(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Large deletes should go out as batches, one request at a time."""
+    monkeypatch.setattr(art_api, "DELETE_BATCH_SIZE", 2)
+    art = _connected_art()
+    active = 0
+
+    async def send_art_request(request_data, *args, **kwargs):
+        nonlocal active
+        active += 1
+        assert active == 1
+        await asyncio.sleep(0)
+        active -= 1
+        return {"event": "image_deleted"}
+
+    art._send_art_request = AsyncMock(side_effect=send_art_request)
+
+    assert await art.delete_list(["a", "b", "c", "d", "e"]) is True
+    assert [
+        [item["content_id"] for item in call.args[0]["content_id_list"]]
+        for call in art._send_art_request.await_args_list
+    ] == [["a", "b"], ["c", "d"], ["e"]]
+
+
+@pytest.mark.asyncio
+async def test_color_temperature_timeout_retries_later() -> None:
+    """An unanswered color temperature request should be retried, not latched off."""
+    art = _connected_art()
+    art._send_art_request = AsyncMock(return_value=None)
+    art.get_artmode_settings = AsyncMock(return_value={"value": "2"})
+
+    assert await art.get_color_temperature() == {"value": "2"}
+    assert await art.get_color_temperature() == {"value": "2"}
+
+    assert art._send_art_request.await_count == 1
+    assert art._supports_get_color_temperature is None
+    assert art._color_temperature_retry_at > time.monotonic()
+
+    art._color_temperature_retry_at = 0.0
+    art._send_art_request.return_value = {"event": "color_temperature", "value": "3"}
+
+    assert await art.get_color_temperature() == {
+        "event": "color_temperature",
+        "value": "3",
+    }
+    assert art._supports_get_color_temperature is True
+
+
+@pytest.mark.asyncio
+async def test_color_temperature_error_latches_settings_fallback() -> None:
+    """An explicit error should stop sending get_color_temperature."""
+    art = _connected_art()
+    art._send_art_request = AsyncMock(
+        return_value={"event": "error", "error_code": "-1"}
+    )
+    art.get_artmode_settings = AsyncMock(return_value={"value": "2"})
+
+    assert await art.get_color_temperature() == {"value": "2"}
+    assert await art.get_color_temperature() == {"value": "2"}
+
+    assert art._send_art_request.await_count == 1
+    assert art._supports_get_color_temperature is False
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_one_request() -> None:
+    """Concurrent parameterless reads should share one websocket round-trip."""
+    art = _connected_art()
+
+    first = asyncio.create_task(art.get_artmode())
+    second = asyncio.create_task(art.get_artmode())
+    await asyncio.sleep(0)
+
+    art._process_event(
+        D2D_SERVICE_MESSAGE_EVENT,
+        {"data": json.dumps({"event": "artmode_status", "value": "on"})},
+    )
+
+    assert await first == "on"
+    assert await second == "on"
+    assert art._ws.send_str.await_count == 1
+    assert not art._inflight
+    assert not art._pending_requests
+
+
+@pytest.mark.asyncio
+async def test_cancelled_follower_does_not_cancel_shared_read() -> None:
+    """Cancelling a caller waiting on a shared read should leave the request running."""
+    art = _connected_art()
+
+    leader = asyncio.create_task(art.get_artmode())
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(art.get_artmode())
+    await asyncio.sleep(0)
+
+    follower.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await follower
+
+    art._process_event(
+        D2D_SERVICE_MESSAGE_EVENT,
+        {"data": json.dumps({"event": "artmode_status", "value": "off"})},
+    )
+
+    assert await leader == "off"
+    assert art._ws.send_str.await_count == 1
@@ -0,0 +1,242 @@
+"""Tests for the samsungtv_artmode setup helpers."""
+
+from __future__ import annotations
+
+import socket
+import time
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+
+from homeassistant.config_entries import ConfigEntryState
+
+from custom_components.samsungtv_artmode import (
+    HOST_RESOLVE_CACHE_SIZE,
+    OAUTH_TOKEN_STALE_BUFFER,
+    WS_AUTH_TIMEOUT,
+    _OAUTH_STATES,
+    _RESOLVED_HOSTS,
+    SamsungTVInfo,
+    _async_arm_oauth_refresh,
+    _async_clear_oauth_state,
+    _async_schedule_oauth_refresh,
+    _get_oauth_state,
+    async_get_samsungtv_api_key,
+    async_refresh_oauth_token,
+    async_resolve_host,
+)
+from custom_components.samsungtv_artmode.const import (
+    AUTH_METHOD_OAUTH,
+    CONF_AUTH_METHOD,
+    CONF_OAUTH_TOKEN,
+    DEFAULT_TIMEOUT,
+    RESULT_NOT_SUCCESSFUL,
+    RESULT_SUCCESS,
+)
+
+ENTRY_ID = "samsungtv_entry"
+
+
+@pytest.fixture(autouse=True)
+def clear_module_caches():
+    """Reset module level caches and OAuth state around each test."""
+    _RESOLVED_HOSTS.clear()
+    yield
+    _RESOLVED_HOSTS.clear()
+    _async_clear_oauth_state(ENTRY_ID)
+
+
+def _resolver_hass() -> MagicMock:
+    """Return a hass mock whose resolver maps every name to one address."""
+    hass = MagicMock()
+    hass.loop.getaddrinfo = AsyncMock(
+        return_value=[
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.168.1.38", 0))
+        ]
+    )
+    return hass
+
+
+def _oauth_entry(expires_at: float, state=ConfigEntryState.LOADED) -> MagicMock:
+    """Return a config entry mock using OAuth with the given token expiry."""
+    return MagicMock(
+        entry_id=ENTRY_ID,
+        state=state,
+        data={
+            CONF_AUTH_METHOD: AUTH_METHOD_OAUTH,
+            CONF_OAUTH_TOKEN: {
+                "access_token": "access",
+                "refresh_token": "refresh",
+                "expires_at": expires_at,
+            },
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_resolve_host_passes_ip_address_through() -> None:
+    """IP addresses should not be looked up."""
+    hass = _resolver_hass()
+
+    assert await async_resolve_host(hass, "192.168.1.40") == "192.168.1.40"
+    hass.loop.getaddrinfo.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_resolve_host_caches_result() -> None:
+    """Repeated lookups of one name should reuse the cached address."""
+    hass = _resolver_hass()
+
+    assert await async_resolve_host(hass, "frame.local") == "192.168.1.38"
+    assert await async_resolve_host(hass, "frame.local") == "192.168.1.38"
+
+    hass.loop.getaddrinfo.assert_awaited_once_with(
+        "frame.local", None, family=socket.AF_INET, type=socket.SOCK_STREAM
+    )
+
+
+@pytest.mark.asyncio
+async def test_resolve_host_cache_is_bounded() -> None:
+    """The least recently used name should be dropped once the cache is full."""
+    hass = _resolver_hass()
+
+    for index in range(HOST_RESOLVE_CACHE_SIZE + 1):
+        await async_resolve_host(hass, f"frame{index}.local")
+
+    assert len(_RESOLVED_HOSTS) == HOST_RESOLVE_CACHE_SIZE
+    assert "frame0.local" not in _RESOLVED_HOSTS
+    assert f"frame{HOST_RESOLVE_CACHE_SIZE}.local" in _RESOLVED_HOSTS
+
+
+@pytest.mark.asyncio
+async def test_resolve_host_raises_on_failure() -> None:
+    """Names that cannot be resolved should raise OSError and not be cached."""
+    hass = MagicMock()
+    hass.loop.getaddrinfo = AsyncMock(side_effect=socket.gaierror("not found"))
+
+    with pytest.raises(OSError):
+        await async_resolve_host(hass, "missing.local")
+    assert "missing.local" not in _RESOLVED_HOSTS
+
+
+def _tv_info() -> SamsungTVInfo:
+    """Return a SamsungTVInfo whose executor jobs run inline."""
+    hass = MagicMock()
+    hass.async_add_executor_job = AsyncMock(
+        side_effect=lambda func, *args: func(*args)
+    )
+    with patch(
+        "custom_components.samsungtv_artmode.async_get_clientsession"
+    ):
+        return SamsungTVInfo(hass, "192.168.1.38", "Home Assistant")
+
+
+@pytest.mark.asyncio
+async def test_ws_probe_tries_token_port_first() -> None:
+    """The stored token should be tried before ports that show the auth popup."""
+    tv_info = _tv_info()
+    tv_info._ws_port = 8002
+    tv_info._ws_token = "token"
+
+    with patch(
+        "custom_components.samsungtv_artmode.SamsungTVWS.ping_probe",
+        return_value=8002,
+    ), patch.object(
+        SamsungTVInfo,
+        "_try_connect_ws_port",
+        side_effect=[
+            (RESULT_NOT_SUCCESSFUL, None),
+            (RESULT_SUCCESS, "new_token"),
+        ],
+    ) as try_connect:
+        assert await tv_info._async_try_connect_ws() == RESULT_SUCCESS
+
+    assert try_connect.call_args_list == [
+        call(8002, "token", DEFAULT_TIMEOUT),
+        call(8001, None, WS_AUTH_TIMEOUT),
+    ]
+    assert tv_info.ws_port == 8001
+    assert tv_info.ws_token == "new_token"
+
+
+@pytest.mark.asyncio
+async def test_ws_probe_tries_popup_ports_one_at_a_time() -> None:
+    """Without a token, 8001 and 8002 should be probed in order."""
+    tv_info = _tv_info()
+
+    with patch(
+        "custom_components.samsungtv_artmode.SamsungTVWS.ping_probe",
+        return_value=8001,
+    ), patch.object(
+        SamsungTVInfo,
+        "_try_connect_ws_port",
+        return_value=(RESULT_NOT_SUCCESSFUL, None),
+    ) as try_connect:
+        assert await tv_info._async_try_connect_ws() == RESULT_NOT_SUCCESSFUL
+
+    assert try_connect.call_args_list == [
+        call(8001, None, WS_AUTH_TIMEOUT),
+        call(8002, None, WS_AUTH_TIMEOUT),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stale_oauth_token_refreshes_in_background() -> None:
+    """A token close to expiry should be used while one refresh runs in background."""
+    hass = MagicMock()
+    hass.async_create_background_task = MagicMock(
+        side_effect=lambda coro, name: coro.close()
+    )
+    entry = _oauth_entry(time.time() + OAUTH_TOKEN_STALE_BUFFER / 2)
+
+    assert await async_get_samsungtv_api_key(hass, entry) == "access"
+    assert await async_get_samsungtv_api_key(hass, entry) == "access"
+
+    hass.async_create_background_task.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_refresh_oauth_token_skips_fresh_token() -> None:
+    """A token refreshed by another caller should be returned as is."""
+    hass = MagicMock()
+    entry = _oauth_entry(time.time() + OAUTH_TOKEN_STALE_BUFFER * 2)
+
+    with patch(
+        "custom_components.samsungtv_artmode.config_entry_oauth2_flow"
+    ) as oauth2_flow:
+        assert await async_refresh_oauth_token(hass, entry) == "access"
+
+    oauth2_flow.async_get_config_entry_implementation.assert_not_called()
+    hass.config_entries.async_update_entry.assert_not_called()
+
+
+def test_arm_oauth_refresh_schedules_before_token_is_stale() -> None:
+    """The refresh timer should fire one stale buffer before expiry."""
+    hass = MagicMock()
+    expires_at = time.time() + 3600
+    entry = _oauth_entry(expires_at)
+    _get_oauth_state(ENTRY_ID)
+
+    _async_arm_oauth_refresh(hass, entry, entry.data[CONF_OAUTH_TOKEN])
+
+    hass.loop.call_later.assert_called_once()
+    delay, callback, *args = hass.loop.call_later.call_args.args
+    assert delay == pytest.approx(3600 - OAUTH_TOKEN_STALE_BUFFER, abs=5)
+    assert callback is _async_schedule_oauth_refresh
+    assert args == [hass, entry]
+    assert _OAUTH_STATES[ENTRY_ID].refresh_timer is hass.loop.call_later.return_value
+
+
+@pytest.mark.parametrize("cleared", [True, False])
+def test_arm_oauth_refresh_skips_unloaded_entry(cleared: bool) -> None:
+    """A refresh finishing after unload should not schedule another one."""
+    hass = MagicMock()
+    entry = _oauth_entry(time.time() + 3600, state=ConfigEntryState.NOT_LOADED)
+    _get_oauth_state(ENTRY_ID)
+    if cleared:
+        _async_clear_oauth_state(ENTRY_ID)
+        entry.state = ConfigEntryState.LOADED
+
+    _async_arm_oauth_refresh(hass, entry, entry.data[CONF_OAUTH_TOKEN])
+
+    hass.loop.call_later.assert_not_called()